@@ -6,14 +6,19 @@ using the cryptography library (Fernet symmetric encryption).
 
 import base64
 import hashlib
+from functools import lru_cache
 
 from cryptography.fernet import Fernet, InvalidToken
 from pydantic import SecretStr
 
 
+@lru_cache(maxsize=8)
 def _derive_key(secret: str) -> bytes:
     """Derive a Fernet-compatible key from the session secret using PBKDF2.
 
+    The derivation is deterministic and deliberately slow, so results are cached
+    per secret rather than recomputed on every encrypt and decrypt.
+
     Args:
         secret: The session secret key
 
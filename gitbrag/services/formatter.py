@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from logging import getLogger
 
 from rich.console import Console
@@ -12,10 +13,11 @@ logger = getLogger(__name__)
 
 
 def format_pr_list(
-    pull_requests: list[PullRequestInfo],
+    pull_requests: Sequence[PullRequestInfo],
     show_urls: bool = False,
     sort_fields: list[tuple[str, str]] | None = None,
     repo_roles: dict[str, str | None] | None = None,
+    console: Console | None = None,
 ) -> None:
     """Format and display pull request list using Rich library.
 
@@ -24,11 +26,13 @@ def format_pr_list(
         show_urls: Whether to display PR URLs (default: False)
         sort_fields: List of (field, direction) tuples for sorting (default: [("created_at", "desc")])
         repo_roles: Repository-level role mapping (default: None)
+        console: Console to render to (default: a new stdout Console)
 
     Valid sort fields: repository, state, created_at, merged_at, title, stars
     Valid sort directions: asc, desc
     """
-    console = Console()
+    if console is None:
+        console = Console()
 
     if not pull_requests:
         console.print(
@@ -47,7 +51,7 @@ def format_pr_list(
     sorted_prs = _sort_pull_requests(pull_requests, sort_fields)
 
     # Display summary statistics first
-    _display_summary_statistics(sorted_prs, repo_roles)
+    _display_summary_statistics(sorted_prs, repo_roles, console)
 
     # Create table
     table = Table(title="Pull Requests", show_header=True, header_style="bold magenta")
@@ -124,19 +128,19 @@ def format_pr_list(
 
 
 def _sort_pull_requests(
-    pull_requests: list[PullRequestInfo],
+    pull_requests: Sequence[PullRequestInfo],
     sort_fields: list[tuple[str, str]],
 ) -> list[PullRequestInfo]:
     """Sort pull requests by specified fields.
 
     Args:
-        pull_requests: List of pull requests to sort
+        pull_requests: Pull requests to sort (not modified)
         sort_fields: List of (field, direction) tuples
 
     Returns:
         Sorted list of pull requests
     """
-    sorted_prs = pull_requests.copy()
+    sorted_prs = list(pull_requests)
 
     # Sort in reverse order of sort_fields to apply primary sort last
     for field, direction in reversed(sort_fields):
@@ -182,14 +186,17 @@ def _sort_pull_requests(
 def _display_summary_statistics(
     pull_requests: list[PullRequestInfo],
     repo_roles: dict[str, str | None] | None = None,
+    console: Console | None = None,
 ) -> None:
     """Display summary statistics for pull requests.
 
     Args:
         pull_requests: List of pull requests
         repo_roles: Repository-level role mapping
+        console: Console to render to (default: a new stdout Console)
     """
-    console = Console()
+    if console is None:
+        console = Console()
 
     # Calculate aggregate code statistics
     total_additions = sum(pr.additions or 0 for pr in pull_requests)
@@ -9,12 +9,16 @@ if "SESSION_SECRET_KEY" not in os.environ:
 if "CACHE_ENABLED" not in os.environ:
     os.environ["CACHE_ENABLED"] = "true"
 
+from datetime import datetime
+
 import pytest
 import pytest_asyncio
 from fastapi.testclient import TestClient
 from pydantic import SecretStr
+from typer.testing import CliRunner
 
 from gitbrag.services.github.client import GitHubAPIClient
+from gitbrag.services.github.models import PullRequestInfo
 from gitbrag.www import app
 
 
@@ -29,3 +33,28 @@ async def fastapi_client():
 def mock_client() -> GitHubAPIClient:
     """Create a test GitHub API client for mocking."""
     return GitHubAPIClient(token=SecretStr("test_token"))
+
+
+@pytest.fixture(scope="session")
+def runner() -> CliRunner:
+    """Provide a Typer CLI test runner shared across the session."""
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def mock_sample_prs() -> list[PullRequestInfo]:
+    """Create sample PRs for testing, shared read-only across the session."""
+    return [
+        PullRequestInfo(
+            number=1,
+            title="Test PR 1",
+            repository="owner/repo",
+            url="https://github.com/owner/repo/pull/1",
+            state="open",
+            created_at=datetime(2024, 1, 1),
+            merged_at=None,
+            closed_at=None,
+            author="testuser",
+            organization="owner",
+        ),
+    ]
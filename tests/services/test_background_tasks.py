@@ -1,9 +1,9 @@
 """Unit tests for background task management."""
 
+from types import MappingProxyType, SimpleNamespace
 from unittest.mock import AsyncMock, patch
 
 import pytest
-import pytest_asyncio
 from fastapi import BackgroundTasks
 
 from gitbrag.services.background_tasks import (
@@ -13,8 +13,19 @@ from gitbrag.services.background_tasks import (
 )
 from gitbrag.services.cache import configure_caches, get_cache
 
+# Read-only metadata for the "testuser:1_year:abc123" task registered by several tests.
+# start_task serializes its argument with json, so pass a dict() copy rather than the proxy.
+TASK_METADATA = MappingProxyType(
+    {
+        "username": "testuser",
+        "period": "1_year",
+        "params_hash": "abc123",
+        "started_at": 1234567890,
+    }
+)
+
 
-@pytest_asyncio.fixture(autouse=True)
+@pytest.fixture(autouse=True)
 async def setup_cache():
     """Set up cache for all tests."""
     configure_caches()
@@ -24,6 +35,18 @@ async def setup_cache():
     await cache.clear()
 
 
+@pytest.fixture
+def background_tasks() -> BackgroundTasks:
+    """Provide a fresh BackgroundTasks instance for scheduling tests."""
+    return BackgroundTasks()
+
+
+@pytest.fixture
+def background_tasks_pair() -> tuple[BackgroundTasks, BackgroundTasks]:
+    """Provide two independent BackgroundTasks instances for multi-user scheduling tests."""
+    return BackgroundTasks(), BackgroundTasks()
+
+
 def test_generate_params_hash_consistency():
     """Test that generate_params_hash creates consistent hashes."""
     hash1 = generate_params_hash(show_star_increase=True)
@@ -36,9 +59,8 @@ def test_generate_params_hash_consistency():
 
 
 @pytest.mark.asyncio
-async def test_schedule_report_generation_registers_task():
+async def test_schedule_report_generation_registers_task(background_tasks: BackgroundTasks):
     """Test that schedule_report_generation registers task and schedules background work."""
-    background_tasks = BackgroundTasks()
     username = "testuser"
     period = "1_year"
     params_hash = "abc123"
@@ -68,9 +90,8 @@ async def test_schedule_report_generation_registers_task():
 
 
 @pytest.mark.asyncio
-async def test_schedule_report_generation_returns_false_for_duplicate():
+async def test_schedule_report_generation_returns_false_for_duplicate(background_tasks: BackgroundTasks):
     """Test that schedule_report_generation returns False for duplicate tasks."""
-    background_tasks = BackgroundTasks()
     username = "testuser"
     period = "1_year"
     params_hash = "abc123"
@@ -106,9 +127,8 @@ async def test_schedule_report_generation_returns_false_for_duplicate():
 
 
 @pytest.mark.asyncio
-async def test_schedule_report_generation_respects_per_user_limits():
+async def test_schedule_report_generation_respects_per_user_limits(background_tasks: BackgroundTasks):
     """Test that schedule_report_generation respects per-reported-user limits."""
-    background_tasks = BackgroundTasks()
     username = "testuser"
     token = "test_token"
 
@@ -143,10 +163,11 @@ async def test_schedule_report_generation_respects_per_user_limits():
 
 
 @pytest.mark.asyncio
-async def test_schedule_report_allows_concurrent_tasks_for_different_users():
+async def test_schedule_report_allows_concurrent_tasks_for_different_users(
+    background_tasks_pair: tuple[BackgroundTasks, BackgroundTasks],
+):
     """Test that schedule_report_generation allows concurrent tasks for different reported users."""
-    background_tasks1 = BackgroundTasks()
-    background_tasks2 = BackgroundTasks()
+    background_tasks1, background_tasks2 = background_tasks_pair
     token = "test_token"
 
     with patch("gitbrag.services.background_tasks.GitHubAPIClient") as mock_client_class:
@@ -239,14 +260,7 @@ async def test_generate_report_background_cleans_up_on_failure():
     token = None
 
     # Register task first
-    metadata = {
-        "username": username,
-        "period": period,
-        "params_hash": params_hash,
-        "started_at": 1234567890,
-    }
-    await start_task(task_id, metadata)
-    assert await is_task_active(task_id) is True
+    assert await start_task(task_id, dict(TASK_METADATA)) is True
 
     # Mock generate_report_data to raise an exception
     with patch("gitbrag.services.background_tasks.generate_report_data", new_callable=AsyncMock) as mock_generate:
@@ -277,13 +291,7 @@ async def test_generate_report_background_handles_github_api_errors():
     token = None
 
     # Register task
-    metadata = {
-        "username": username,
-        "period": period,
-        "params_hash": params_hash,
-        "started_at": 1234567890,
-    }
-    await start_task(task_id, metadata)
+    await start_task(task_id, dict(TASK_METADATA))
 
     # Mock GitHub API error
     with patch("gitbrag.services.background_tasks.generate_report_data", new_callable=AsyncMock) as mock_generate:
@@ -306,9 +314,8 @@ async def test_generate_report_background_handles_github_api_errors():
 
 
 @pytest.mark.asyncio
-async def test_schedule_report_with_invalid_token():
+async def test_schedule_report_with_invalid_token(background_tasks: BackgroundTasks):
     """Test that schedule_report_generation returns False with invalid token."""
-    background_tasks = BackgroundTasks()
     username = "testuser"
     period = "1_year"
     params_hash = "abc123"
@@ -337,9 +344,8 @@ async def test_schedule_report_with_invalid_token():
 
 
 @pytest.mark.asyncio
-async def test_schedule_report_with_valid_token():
+async def test_schedule_report_with_valid_token(background_tasks: BackgroundTasks):
     """Test that schedule_report_generation succeeds with valid token."""
-    background_tasks = BackgroundTasks()
     username = "testuser"
     period = "1_year"
     params_hash = "abc123"
@@ -368,9 +374,8 @@ async def test_schedule_report_with_valid_token():
 
 
 @pytest.mark.asyncio
-async def test_schedule_report_with_validation_error():
+async def test_schedule_report_with_validation_error(background_tasks: BackgroundTasks):
     """Test that schedule_report_generation returns False when validation raises exception."""
-    background_tasks = BackgroundTasks()
     username = "testuser"
     period = "1_year"
     params_hash = "abc123"
@@ -412,21 +417,15 @@ async def test_generate_report_background_aborts_on_401_error():
     token = "expired_token"
 
     # Register task
-    metadata = {
-        "username": username,
-        "period": period,
-        "params_hash": params_hash,
-        "started_at": 1234567890,
-    }
-    await start_task(task_id, metadata)
+    assert await start_task(task_id, dict(TASK_METADATA)) is True
 
     # Mock generate_report_data to raise 401 error
-    mock_response = AsyncMock()
-    mock_response.status_code = 401
-    mock_response.headers = {}
+    mock_response = SimpleNamespace(status_code=401, headers={})
 
     with patch("gitbrag.services.background_tasks.generate_report_data", new_callable=AsyncMock) as mock_generate:
-        mock_generate.side_effect = httpx.HTTPStatusError("Unauthorized", request=AsyncMock(), response=mock_response)
+        mock_generate.side_effect = httpx.HTTPStatusError(
+            "Unauthorized", request=SimpleNamespace(), response=mock_response
+        )
 
         # Should not raise exception
         await generate_report_background(
@@ -455,21 +454,15 @@ async def test_generate_report_background_aborts_on_403_auth_error():
     token = "forbidden_token"
 
     # Register task
-    metadata = {
-        "username": username,
-        "period": period,
-        "params_hash": params_hash,
-        "started_at": 1234567890,
-    }
-    await start_task(task_id, metadata)
+    assert await start_task(task_id, dict(TASK_METADATA)) is True
 
     # Mock generate_report_data to raise 403 error (not rate limit)
-    mock_response = AsyncMock()
-    mock_response.status_code = 403
-    mock_response.headers = {"X-RateLimit-Remaining": "100"}  # Not a rate limit
+    mock_response = SimpleNamespace(status_code=403, headers={"X-RateLimit-Remaining": "100"})  # Not a rate limit
 
     with patch("gitbrag.services.background_tasks.generate_report_data", new_callable=AsyncMock) as mock_generate:
-        mock_generate.side_effect = httpx.HTTPStatusError("Forbidden", request=AsyncMock(), response=mock_response)
+        mock_generate.side_effect = httpx.HTTPStatusError(
+            "Forbidden", request=SimpleNamespace(), response=mock_response
+        )
 
         # Should not raise exception
         await generate_report_background(
@@ -498,22 +491,14 @@ async def test_generate_report_background_continues_on_rate_limit():
     token = "valid_token"
 
     # Register task
-    metadata = {
-        "username": username,
-        "period": period,
-        "params_hash": params_hash,
-        "started_at": 1234567890,
-    }
-    await start_task(task_id, metadata)
+    assert await start_task(task_id, dict(TASK_METADATA)) is True
 
     # Mock generate_report_data to raise 403 rate limit error
-    mock_response = AsyncMock()
-    mock_response.status_code = 403
-    mock_response.headers = {"X-RateLimit-Remaining": "0"}  # This is a rate limit
+    mock_response = SimpleNamespace(status_code=403, headers={"X-RateLimit-Remaining": "0"})  # This is a rate limit
 
     with patch("gitbrag.services.background_tasks.generate_report_data", new_callable=AsyncMock) as mock_generate:
         mock_generate.side_effect = httpx.HTTPStatusError(
-            "Rate limit exceeded", request=AsyncMock(), response=mock_response
+            "Rate limit exceeded", request=SimpleNamespace(), response=mock_response
         )
 
         # Should not raise exception
@@ -3,7 +3,7 @@
 import pytest
 from pydantic import SecretStr
 
-from gitbrag.services.encryption import decrypt_token, encrypt_token, verify_encryption_roundtrip
+from gitbrag.services.encryption import _derive_key, decrypt_token, encrypt_token, verify_encryption_roundtrip
 
 
 def test_encrypt_token_with_secret_str() -> None:
@@ -129,6 +129,20 @@ def test_verify_encryption_roundtrip_failure() -> None:
     assert result is False
 
 
+def test_derive_key_is_cached_per_secret() -> None:
+    """Test that key derivation runs once per secret and is reused afterwards."""
+    _derive_key.cache_clear()
+
+    first = _derive_key("my-secret-key-for-testing")
+    second = _derive_key("my-secret-key-for-testing")
+    other = _derive_key("another-secret-key")
+
+    assert first is second
+    assert first != other
+    assert _derive_key.cache_info().hits == 1
+    assert _derive_key.cache_info().misses == 2
+
+
 def test_consistent_encryption_different_each_time() -> None:
     """Test that encrypting the same token twice produces different ciphertext (due to IV)."""
     token = SecretStr("my-test-token")
@@ -1,6 +1,9 @@
+import logging
+import re
+from collections.abc import Sequence
 from datetime import datetime
-from io import StringIO
-from unittest.mock import patch
+from io import BytesIO, TextIOWrapper
+from typing import Any, NamedTuple
 
 import pytest
 from rich.console import Console
@@ -8,18 +11,104 @@ from rich.console import Console
 from gitbrag.services.formatter import format_pr_list, show_progress
 from gitbrag.services.github.models import PullRequestInfo
 
+# Noon timestamps shared by the sample PRs and the sorting tests
+_JAN1 = datetime(2024, 1, 1, 12, 0, 0)
+_JAN2 = datetime(2024, 1, 2, 12, 0, 0)
+_JAN3 = datetime(2024, 1, 3, 12, 0, 0)
+_JAN4 = datetime(2024, 1, 4, 12, 0, 0)
+
+
+class RenderedConsole(NamedTuple):
+    """Console that formatter output is routed to, and the byte buffer it writes into."""
+
+    console: Console
+    buffer: BytesIO
+
+    def text(self) -> str:
+        """Decode everything rendered so far."""
+        return self.buffer.getvalue().decode("utf-8")
+
+
+def _new_rendered_console(width: int = 120) -> RenderedConsole:
+    """Create an in-memory console to pass to the formatter.
+
+    Styling is disabled so the buffer holds plain text with no ANSI escape codes.
+    """
+    buffer = BytesIO()
+    output = TextIOWrapper(buffer, encoding="utf-8", newline="", write_through=True)
+    console = Console(file=output, force_terminal=False, color_system=None, width=width)
+    return RenderedConsole(console, buffer)
+
 
 @pytest.fixture
-def sample_prs() -> list[PullRequestInfo]:
-    """Create sample pull requests for testing."""
-    return [
+def rendered_console() -> RenderedConsole:
+    """Provide a fresh in-memory console for a single render."""
+    return _new_rendered_console()
+
+
+def _positions(result: str, needles: list[str]) -> dict[str, int]:
+    """Find the first position of each needle in a single pass over the rendered output."""
+    # Longest first so a needle that prefixes another cannot shadow it in the alternation
+    pattern = re.compile("|".join(re.escape(needle) for needle in sorted(needles, key=len, reverse=True)))
+    positions: dict[str, int] = {}
+    for match in pattern.finditer(result):
+        positions.setdefault(match.group(), match.start())
+    missing = [needle for needle in needles if needle not in positions]
+    assert not missing, f"Not found in output: {missing}"
+    return positions
+
+
+def _assert_order(result: str, *needles: str) -> None:
+    """Assert that each needle first appears in result in the order given."""
+    positions = _positions(result, list(needles))
+    assert sorted(needles, key=positions.__getitem__) == list(needles), f"Out of order: {positions}"
+
+
+# Text the default sample_prs render must contain: table headers, PR titles and the total line
+_BASIC_EXPECTED = (
+    "Pull Requests",
+    "PR #",
+    "State",
+    "Repository",
+    "Title",
+    "Created",
+    "Add feature A",
+    "Fix bug B",
+    "Update docs",
+    "Total",
+    "3",
+    "pull requests",
+)
+
+
+def _make_pr(number: int, title: str, created_at: datetime, **fields: Any) -> PullRequestInfo:
+    """Build a PR in owner/repo with only the fields a sorting test cares about."""
+    defaults: dict[str, Any] = {
+        "repository": "owner/repo",
+        "url": f"https://github.com/owner/repo/pull/{number}",
+        "state": "open",
+        "merged_at": None,
+        "closed_at": None,
+        "author": "testuser",
+        "organization": "owner",
+    }
+    return PullRequestInfo(number=number, title=title, created_at=created_at, **{**defaults, **fields})
+
+
+@pytest.fixture(scope="module")
+def sample_prs() -> tuple[PullRequestInfo, ...]:
+    """Create sample pull requests for testing.
+
+    Module scoped and returned as a tuple because format_pr_list only reads its input.
+    """
+    return (
         PullRequestInfo(
             number=1,
             title="Add feature A",
             repository="owner/repo1",
             url="https://github.com/owner/repo1/pull/1",
             state="open",
-            created_at=datetime(2024, 1, 1, 12, 0, 0),
+            created_at=_JAN1,
             merged_at=None,
             closed_at=None,
             author="testuser",
@@ -31,9 +120,9 @@ def sample_prs() -> list[PullRequestInfo]:
             repository="owner/repo2",
             url="https://github.com/owner/repo2/pull/2",
             state="closed",
-            created_at=datetime(2024, 1, 2, 12, 0, 0),
-            merged_at=datetime(2024, 1, 3, 12, 0, 0),
-            closed_at=datetime(2024, 1, 3, 12, 0, 0),
+            created_at=_JAN2,
+            merged_at=_JAN3,
+            closed_at=_JAN3,
             author="testuser",
             organization="owner",
         ),
@@ -43,188 +132,179 @@ def sample_prs() -> list[PullRequestInfo]:
             repository="owner/repo1",
             url="https://github.com/owner/repo1/pull/3",
             state="closed",
-            created_at=datetime(2024, 1, 3, 12, 0, 0),
+            created_at=_JAN3,
             merged_at=None,
-            closed_at=datetime(2024, 1, 4, 12, 0, 0),
+            closed_at=_JAN4,
             author="testuser",
             organization="owner",
         ),
-    ]
-
-
-def test_format_pr_list_basic(sample_prs: list[PullRequestInfo]) -> None:
-    """Test basic PR list formatting."""
-    output = StringIO()
-    console = Console(file=output, force_terminal=True, width=120)
-
-    with patch("gitbrag.services.formatter.Console", return_value=console):
-        format_pr_list(sample_prs)
-
-    result = output.getvalue()
-
-    # Check that table is created
-    assert "Pull Requests" in result
-    assert "PR #" in result
-    assert "State" in result
-    assert "Repository" in result
-    assert "Title" in result
-    assert "Created" in result
-
-    # Check PR content
-    assert "Add feature A" in result
-    assert "Fix bug B" in result
-    assert "Update docs" in result
-
-    # Check total count (Rich adds formatting codes, so check for core text)
-    assert "Total" in result
-    assert "3" in result
-    assert "pull requests" in result
-
-
-def test_format_pr_list_with_urls(sample_prs: list[PullRequestInfo]) -> None:
-    """Test PR list formatting with URLs displayed."""
-    output = StringIO()
-    console = Console(file=output, force_terminal=True, width=120)
-
-    with patch("gitbrag.services.formatter.Console", return_value=console):
-        format_pr_list(sample_prs, show_urls=True)
+    )
 
-    result = output.getvalue()
 
-    # Check URL column header
-    assert "URL" in result
+@pytest.fixture(scope="module")
+def default_rendered(sample_prs: Sequence[PullRequestInfo]) -> str:
+    """Render sample_prs with default options once and share the output."""
+    rendered = _new_rendered_console()
+    format_pr_list(sample_prs, console=rendered.console)
+    return rendered.text()
 
-    # Check URLs are displayed
-    assert "https://github.com/owner/repo1/pull/1" in result
-    assert "https://github.com/owner/repo2/pull/2" in result
 
+def test_format_pr_list_basic(default_rendered: str) -> None:
+    """Test basic PR list formatting."""
+    _positions(default_rendered, list(_BASIC_EXPECTED))
 
-def test_format_pr_list_without_urls(sample_prs: list[PullRequestInfo]) -> None:
-    """Test PR list formatting without URLs (default)."""
-    output = StringIO()
-    console = Console(file=output, force_terminal=True, width=120)
 
-    with patch("gitbrag.services.formatter.Console", return_value=console):
-        format_pr_list(sample_prs, show_urls=False)
+@pytest.mark.parametrize(
+    ("kwargs", "expected"),
+    [
+        pytest.param(
+            {"show_urls": True},
+            ["URL", "https://github.com/owner/repo1/pull/1", "https://github.com/owner/repo2/pull/2"],
+            id="with_urls",
+        ),
+        # PR numbers are always shown, with or without the URL column
+        pytest.param({"show_urls": False}, ["1", "2", "3"], id="without_urls"),
+    ],
+)
+def test_format_pr_list_contains(
+    sample_prs: Sequence[PullRequestInfo],
+    rendered_console: RenderedConsole,
+    kwargs: dict[str, Any],
+    expected: list[str],
+) -> None:
+    """Test that PR list formatting renders the expected content for each option."""
+    format_pr_list(sample_prs, **kwargs, console=rendered_console.console)
 
-    result = output.getvalue()
+    result = rendered_console.text()
 
-    # URLs should not be in output when show_urls=False
-    # Note: Still check for PR numbers which are always shown
-    assert "1" in result  # PR number
-    assert "2" in result
-    assert "3" in result
+    for text in expected:
+        assert text in result
 
 
 def test_format_pr_list_empty() -> None:
     """Test formatting empty PR list."""
-    output = StringIO()
-    console = Console(file=output, force_terminal=True, width=120)
-
-    with patch("gitbrag.services.formatter.Console", return_value=console):
-        format_pr_list([])
+    # Only the "No Results" panel is drawn, so a narrower console is enough
+    rendered = _new_rendered_console(width=80)
+    format_pr_list([], console=rendered.console)
 
-    result = output.getvalue()
+    result = rendered.text()
 
     # Check for empty message
     assert "No pull requests found" in result
     assert "No Results" in result
 
 
-def test_format_pr_list_state_colors(sample_prs: list[PullRequestInfo]) -> None:
+def test_format_pr_list_state_colors(default_rendered: str) -> None:
     """Test that different PR states have different colors."""
-    output = StringIO()
-    console = Console(file=output, force_terminal=True, width=120)
+    result = default_rendered
 
-    with patch("gitbrag.services.formatter.Console", return_value=console):
-        format_pr_list(sample_prs)
+    # Colors are stripped by the plain-text console, so check each state label is rendered
+    assert "open" in result
+    assert "merged" in result
+    assert "closed" in result
 
-    result = output.getvalue()
 
-    # Rich uses color tags in output
-    # Open PRs should be blue, merged should be green, closed should be yellow
-    assert "open" in result.lower()
-    assert "merged" in result.lower()
-    assert "closed" in result.lower()
-
-
-def test_format_pr_list_sort_by_created_desc(sample_prs: list[PullRequestInfo]) -> None:
+def test_format_pr_list_sort_by_created_desc(default_rendered: str) -> None:
     """Test sorting by created date descending (default)."""
-    output = StringIO()
-    console = Console(file=output, force_terminal=True, width=120)
-
-    with patch("gitbrag.services.formatter.Console", return_value=console):
-        format_pr_list(sample_prs, sort_fields=[("created_at", "desc")])
-
-    result = output.getvalue()
-
     # Should be in order: Update docs (Jan 3), Fix bug B (Jan 2), Add feature A (Jan 1)
-    # Check order by finding positions
-    assert result.index("Update docs") < result.index("Fix bug B")
-    assert result.index("Fix bug B") < result.index("Add feature A")
-
-
-def test_format_pr_list_sort_by_created_asc(sample_prs: list[PullRequestInfo]) -> None:
-    """Test sorting by created date ascending."""
-    output = StringIO()
-    console = Console(file=output, force_terminal=True, width=120)
-
-    with patch("gitbrag.services.formatter.Console", return_value=console):
-        format_pr_list(sample_prs, sort_fields=[("created_at", "asc")])
-
-    result = output.getvalue()
-
-    # Should be in order: Add feature A (Jan 1), Fix bug B (Jan 2), Update docs (Jan 3)
-    assert result.index("Add feature A") < result.index("Fix bug B")
-    assert result.index("Fix bug B") < result.index("Update docs")
-
-
-def test_format_pr_list_sort_by_repository(sample_prs: list[PullRequestInfo]) -> None:
-    """Test sorting by repository name."""
-    output = StringIO()
-    console = Console(file=output, force_terminal=True, width=120)
-
-    with patch("gitbrag.services.formatter.Console", return_value=console):
-        format_pr_list(sample_prs, sort_fields=[("repository", "asc")])
-
-    result = output.getvalue()
-
-    # Should group repo1 together before repo2
-    repo1_positions = [result.index("Add feature A"), result.index("Update docs")]
-    repo2_position = result.index("Fix bug B")
-
-    # Both repo1 PRs should be before repo2 PR
-    assert max(repo1_positions) < repo2_position
-
-
-def test_format_pr_list_sort_by_state(sample_prs: list[PullRequestInfo]) -> None:
-    """Test sorting by state (merged, open, closed)."""
-    output = StringIO()
-    console = Console(file=output, force_terminal=True, width=120)
-
-    with patch("gitbrag.services.formatter.Console", return_value=console):
-        format_pr_list(sample_prs, sort_fields=[("state", "asc")])
-
-    result = output.getvalue()
-
-    # Order should be: merged (Fix bug B), open (Add feature A), closed (Update docs)
-    assert result.index("Fix bug B") < result.index("Add feature A")
-    assert result.index("Add feature A") < result.index("Update docs")
-
-
-def test_format_pr_list_multi_field_sort(sample_prs: list[PullRequestInfo]) -> None:
-    """Test sorting by multiple fields."""
-    output = StringIO()
-    console = Console(file=output, force_terminal=True, width=120)
-
-    # Sort by repository first, then by created date
-    with patch("gitbrag.services.formatter.Console", return_value=console):
-        format_pr_list(sample_prs, sort_fields=[("repository", "asc"), ("created_at", "desc")])
+    _assert_order(default_rendered, "Update docs", "Fix bug B", "Add feature A")
+
+
+@pytest.mark.parametrize(
+    ("sort_fields", "expected_order"),
+    [
+        pytest.param([("created_at", "asc")], ["Add feature A", "Fix bug B", "Update docs"], id="created_asc"),
+        # repo1 PRs grouped before repo2, keeping their original relative order
+        pytest.param([("repository", "asc")], ["Add feature A", "Update docs", "Fix bug B"], id="repository"),
+        # merged (Fix bug B), open (Add feature A), closed (Update docs)
+        pytest.param([("state", "asc")], ["Fix bug B", "Add feature A", "Update docs"], id="state"),
+        # Within repo1, Update docs (Jan 3) comes before Add feature A (Jan 1)
+        pytest.param(
+            [("repository", "asc"), ("created_at", "desc")],
+            ["Update docs", "Add feature A", "Fix bug B"],
+            id="multi_field",
+        ),
+    ],
+)
+def test_format_pr_list_sort_order(
+    sample_prs: Sequence[PullRequestInfo],
+    rendered_console: RenderedConsole,
+    sort_fields: list[tuple[str, str]],
+    expected_order: list[str],
+) -> None:
+    """Test that PRs are rendered in the order given by sort_fields."""
+    format_pr_list(sample_prs, sort_fields=sort_fields, console=rendered_console.console)
+
+    result = rendered_console.text()
+
+    _assert_order(result, *expected_order)
+
+
+@pytest.mark.parametrize(
+    ("prs", "sort_fields", "expected_order"),
+    [
+        pytest.param(
+            (
+                _make_pr(1, "Oldest PR", _JAN1),
+                _make_pr(2, "Newest PR", datetime(2024, 1, 10, 12, 0, 0)),
+            ),
+            [("created_at", "desc")],
+            ["Newest PR", "Oldest PR"],
+            id="created_at_desc",
+        ),
+        # Descending by merge date, unmerged PRs go to the end
+        pytest.param(
+            (
+                _make_pr(1, "Not merged", _JAN1),
+                _make_pr(2, "Merged early", _JAN2, state="closed", merged_at=_JAN3, closed_at=_JAN3),
+                _make_pr(
+                    3,
+                    "Merged late",
+                    datetime(2024, 1, 5, 12, 0, 0),
+                    state="closed",
+                    merged_at=datetime(2024, 1, 10, 12, 0, 0),
+                    closed_at=datetime(2024, 1, 10, 12, 0, 0),
+                ),
+            ),
+            [("merged_at", "desc")],
+            ["Merged late", "Merged early", "Not merged"],
+            id="merged_at_desc_with_none",
+        ),
+        # Ascending by merge date, unmerged PRs still go to the end (dt.max)
+        pytest.param(
+            (
+                _make_pr(1, "Not merged", _JAN1),
+                _make_pr(2, "Merged early", _JAN2, state="closed", merged_at=_JAN3, closed_at=_JAN3),
+            ),
+            [("merged_at", "asc")],
+            ["Merged early", "Not merged"],
+            id="merged_at_asc_with_none",
+        ),
+        # High stars (100), Low stars (5), No star data (None sorts last when descending)
+        pytest.param(
+            (
+                _make_pr(1, "Low stars", _JAN1, star_increase=5),
+                _make_pr(2, "High stars", _JAN2, star_increase=100),
+                _make_pr(3, "No star data", _JAN3, star_increase=None),
+            ),
+            [("stars", "desc")],
+            ["High stars", "Low stars", "No star data"],
+            id="stars_desc",
+        ),
+    ],
+)
+def test_format_pr_list_sort_order_edge_cases(
+    rendered_console: RenderedConsole,
+    prs: tuple[PullRequestInfo, ...],
+    sort_fields: list[tuple[str, str]],
+    expected_order: list[str],
+) -> None:
+    """Test sort order for PRs with missing merge dates, missing star data and wide date gaps."""
+    format_pr_list(prs, sort_fields=sort_fields, console=rendered_console.console)
 
-    result = output.getvalue()
+    result = rendered_console.text()
 
-    # Within repo1: Update docs (Jan 3) should come before Add feature A (Jan 1)
-    assert result.index("Update docs") < result.index("Add feature A")
+    _assert_order(result, *expected_order)
 
 
 def test_show_progress() -> None:
@@ -239,7 +319,7 @@ def test_show_progress() -> None:
     assert progress.tasks[0].description == "Testing..."
 
 
-def test_format_pr_list_with_star_increase() -> None:
+def test_format_pr_list_with_star_increase(rendered_console: RenderedConsole) -> None:
     """Test formatting with star increase data."""
     prs = [
         PullRequestInfo(
@@ -248,7 +328,7 @@ def test_format_pr_list_with_star_increase() -> None:
             repository="owner/repo1",
             url="https://github.com/owner/repo1/pull/1",
             state="open",
-            created_at=datetime(2024, 1, 1, 12, 0, 0),
+            created_at=_JAN1,
             merged_at=None,
             closed_at=None,
             author="testuser",
@@ -261,7 +341,7 @@ def test_format_pr_list_with_star_increase() -> None:
             repository="owner/repo2",
             url="https://github.com/owner/repo2/pull/2",
             state="open",
-            created_at=datetime(2024, 1, 2, 12, 0, 0),
+            created_at=_JAN2,
             merged_at=None,
             closed_at=None,
             author="testuser",
@@ -270,13 +350,9 @@ def test_format_pr_list_with_star_increase() -> None:
         ),
     ]
 
-    output = StringIO()
-    console = Console(file=output, force_terminal=True, width=120)
+    format_pr_list(prs, console=rendered_console.console)
 
-    with patch("gitbrag.services.formatter.Console", return_value=console):
-        format_pr_list(prs)
-
-    result = output.getvalue()
+    result = rendered_console.text()
 
     # Check star column is included
     assert "Stars" in result
@@ -284,48 +360,7 @@ def test_format_pr_list_with_star_increase() -> None:
     assert "0" in result
 
 
-def test_format_pr_list_sort_by_created_at_desc() -> None:
-    """Test sorting by created_at in descending order."""
-    prs = [
-        PullRequestInfo(
-            number=1,
-            title="Oldest PR",
-            repository="owner/repo",
-            url="https://github.com/owner/repo/pull/1",
-            state="open",
-            created_at=datetime(2024, 1, 1, 12, 0, 0),
-            merged_at=None,
-            closed_at=None,
-            author="testuser",
-            organization="owner",
-        ),
-        PullRequestInfo(
-            number=2,
-            title="Newest PR",
-            repository="owner/repo",
-            url="https://github.com/owner/repo/pull/2",
-            state="open",
-            created_at=datetime(2024, 1, 10, 12, 0, 0),
-            merged_at=None,
-            closed_at=None,
-            author="testuser",
-            organization="owner",
-        ),
-    ]
-
-    output = StringIO()
-    console = Console(file=output, force_terminal=True, width=120)
-
-    with patch("gitbrag.services.formatter.Console", return_value=console):
-        format_pr_list(prs, sort_fields=[("created_at", "desc")])
-
-    result = output.getvalue()
-
-    # Newest PR should appear before oldest
-    assert result.index("Newest PR") < result.index("Oldest PR")
-
-
-def test_format_pr_list_star_increase_none() -> None:
+def test_format_pr_list_star_increase_none(rendered_console: RenderedConsole) -> None:
     """Test formatting when star_increase is None (data not available)."""
     prs = [
         PullRequestInfo(
@@ -334,7 +369,7 @@ def test_format_pr_list_star_increase_none() -> None:
             repository="owner/repo1",
             url="https://github.com/owner/repo1/pull/1",
             state="open",
-            created_at=datetime(2024, 1, 1, 12, 0, 0),
+            created_at=_JAN1,
             merged_at=None,
             closed_at=None,
             author="testuser",
@@ -347,7 +382,7 @@ def test_format_pr_list_star_increase_none() -> None:
             repository="owner/repo2",
             url="https://github.com/owner/repo2/pull/2",
             state="open",
-            created_at=datetime(2024, 1, 2, 12, 0, 0),
+            created_at=_JAN2,
             merged_at=None,
             closed_at=None,
             author="testuser",
@@ -356,13 +391,9 @@ def test_format_pr_list_star_increase_none() -> None:
         ),
     ]
 
-    output = StringIO()
-    console = Console(file=output, force_terminal=True, width=120)
+    format_pr_list(prs, console=rendered_console.console)
 
-    with patch("gitbrag.services.formatter.Console", return_value=console):
-        format_pr_list(prs)
-
-    result = output.getvalue()
+    result = rendered_console.text()
 
     # Check that "-" is displayed for None star_increase
     assert "Stars" in result
@@ -370,7 +401,9 @@ def test_format_pr_list_star_increase_none() -> None:
     assert "+50" in result  # For PR with 50
 
 
-def test_format_pr_list_sort_by_unknown_field() -> None:
+def test_format_pr_list_sort_by_unknown_field(
+    rendered_console: RenderedConsole, caplog: pytest.LogCaptureFixture
+) -> None:
     """Test sorting with unknown field logs warning and uses default."""
     prs = [
         PullRequestInfo(
@@ -379,7 +412,7 @@ def test_format_pr_list_sort_by_unknown_field() -> None:
             repository="owner/repo",
             url="https://github.com/owner/repo/pull/1",
             state="open",
-            created_at=datetime(2024, 1, 1, 12, 0, 0),
+            created_at=_JAN1,
             merged_at=None,
             closed_at=None,
             author="testuser",
@@ -387,173 +420,16 @@ def test_format_pr_list_sort_by_unknown_field() -> None:
         ),
     ]
 
-    output = StringIO()
-    console = Console(file=output, force_terminal=True, width=120)
-
-    with patch("gitbrag.services.formatter.Console", return_value=console):
-        with patch("gitbrag.services.formatter.logger") as mock_logger:
-            format_pr_list(prs, sort_fields=[("unknown_field", "asc")])
+    with caplog.at_level(logging.WARNING, logger="gitbrag.services.formatter"):
+        format_pr_list(prs, sort_fields=[("unknown_field", "asc")], console=rendered_console.console)
 
-            # Should log warning about unknown field
-            mock_logger.warning.assert_called_once()
-            assert "Unknown sort field: unknown_field" in str(mock_logger.warning.call_args)
+    # Should log warning about unknown field
+    warnings = [record for record in caplog.records if record.levelno == logging.WARNING]
+    assert len(warnings) == 1
+    assert "Unknown sort field: unknown_field" in warnings[0].getMessage()
 
 
-def test_format_pr_list_sort_by_merged_at_with_none() -> None:
-    """Test sorting by merged_at when some PRs have None for merged_at."""
-    prs = [
-        PullRequestInfo(
-            number=1,
-            title="Not merged",
-            repository="owner/repo",
-            url="https://github.com/owner/repo/pull/1",
-            state="open",
-            created_at=datetime(2024, 1, 1, 12, 0, 0),
-            merged_at=None,  # Not merged
-            closed_at=None,
-            author="testuser",
-            organization="owner",
-        ),
-        PullRequestInfo(
-            number=2,
-            title="Merged early",
-            repository="owner/repo",
-            url="https://github.com/owner/repo/pull/2",
-            state="closed",
-            created_at=datetime(2024, 1, 2, 12, 0, 0),
-            merged_at=datetime(2024, 1, 3, 12, 0, 0),
-            closed_at=datetime(2024, 1, 3, 12, 0, 0),
-            author="testuser",
-            organization="owner",
-        ),
-        PullRequestInfo(
-            number=3,
-            title="Merged late",
-            repository="owner/repo",
-            url="https://github.com/owner/repo/pull/3",
-            state="closed",
-            created_at=datetime(2024, 1, 5, 12, 0, 0),
-            merged_at=datetime(2024, 1, 10, 12, 0, 0),
-            closed_at=datetime(2024, 1, 10, 12, 0, 0),
-            author="testuser",
-            organization="owner",
-        ),
-    ]
-
-    output = StringIO()
-    console = Console(file=output, force_terminal=True, width=120)
-
-    with patch("gitbrag.services.formatter.Console", return_value=console):
-        # Sort descending - None should go to end
-        format_pr_list(prs, sort_fields=[("merged_at", "desc")])
-
-    result = output.getvalue()
-
-    # Order should be: Merged late, Merged early, Not merged
-    assert result.index("Merged late") < result.index("Merged early")
-    assert result.index("Merged early") < result.index("Not merged")
-
-
-def test_format_pr_list_sort_by_stars_desc() -> None:
-    """Test sorting by star increase in descending order."""
-    prs = [
-        PullRequestInfo(
-            number=1,
-            title="Low stars",
-            repository="owner/repo",
-            url="https://github.com/owner/repo/pull/1",
-            state="open",
-            created_at=datetime(2024, 1, 1, 12, 0, 0),
-            merged_at=None,
-            closed_at=None,
-            author="testuser",
-            organization="owner",
-            star_increase=5,
-        ),
-        PullRequestInfo(
-            number=2,
-            title="High stars",
-            repository="owner/repo",
-            url="https://github.com/owner/repo/pull/2",
-            state="open",
-            created_at=datetime(2024, 1, 2, 12, 0, 0),
-            merged_at=None,
-            closed_at=None,
-            author="testuser",
-            organization="owner",
-            star_increase=100,
-        ),
-        PullRequestInfo(
-            number=3,
-            title="No star data",
-            repository="owner/repo",
-            url="https://github.com/owner/repo/pull/3",
-            state="open",
-            created_at=datetime(2024, 1, 3, 12, 0, 0),
-            merged_at=None,
-            closed_at=None,
-            author="testuser",
-            organization="owner",
-            star_increase=None,
-        ),
-    ]
-
-    output = StringIO()
-    console = Console(file=output, force_terminal=True, width=120)
-
-    with patch("gitbrag.services.formatter.Console", return_value=console):
-        format_pr_list(prs, sort_fields=[("stars", "desc")])
-
-    result = output.getvalue()
-
-    # Order should be: High stars (100), Low stars (5), No star data (None/-1 when desc)
-    assert result.index("High stars") < result.index("Low stars")
-    assert result.index("Low stars") < result.index("No star data")
-
-
-def test_format_pr_list_sort_by_merged_at_asc_with_none() -> None:
-    """Test sorting by merged_at ascending when some PRs have None for merged_at."""
-    prs = [
-        PullRequestInfo(
-            number=1,
-            title="Not merged",
-            repository="owner/repo",
-            url="https://github.com/owner/repo/pull/1",
-            state="open",
-            created_at=datetime(2024, 1, 1, 12, 0, 0),
-            merged_at=None,  # Not merged
-            closed_at=None,
-            author="testuser",
-            organization="owner",
-        ),
-        PullRequestInfo(
-            number=2,
-            title="Merged early",
-            repository="owner/repo",
-            url="https://github.com/owner/repo/pull/2",
-            state="closed",
-            created_at=datetime(2024, 1, 2, 12, 0, 0),
-            merged_at=datetime(2024, 1, 3, 12, 0, 0),
-            closed_at=datetime(2024, 1, 3, 12, 0, 0),
-            author="testuser",
-            organization="owner",
-        ),
-    ]
-
-    output = StringIO()
-    console = Console(file=output, force_terminal=True, width=120)
-
-    with patch("gitbrag.services.formatter.Console", return_value=console):
-        # Sort ascending - None should go to end (dt.max)
-        format_pr_list(prs, sort_fields=[("merged_at", "asc")])
-
-    result = output.getvalue()
-
-    # Order should be: Merged early, Not merged (None goes to end when asc)
-    assert result.index("Merged early") < result.index("Not merged")
-
-
-def test_format_pr_list_with_size_column() -> None:
+def test_format_pr_list_with_size_column(rendered_console: RenderedConsole) -> None:
     """Test PR list formatting includes Size column."""
     prs = [
         PullRequestInfo(
@@ -586,13 +462,9 @@ def test_format_pr_list_with_size_column() -> None:
         ),
     ]
 
-    output = StringIO()
-    console = Console(file=output, force_terminal=True, width=120)
-
-    with patch("gitbrag.services.formatter.Console", return_value=console):
-        format_pr_list(prs)
+    format_pr_list(prs, console=rendered_console.console)
 
-    result = output.getvalue()
+    result = rendered_console.text()
 
     # Check Size column header
     assert "Size" in result
@@ -601,7 +473,7 @@ def test_format_pr_list_with_size_column() -> None:
     assert "Large" in result
 
 
-def test_format_pr_list_with_summary_statistics() -> None:
+def test_format_pr_list_with_summary_statistics(rendered_console: RenderedConsole) -> None:
     """Test PR list formatting includes summary statistics."""
     prs = [
         PullRequestInfo(
@@ -636,13 +508,9 @@ def test_format_pr_list_with_summary_statistics() -> None:
         ),
     ]
 
-    output = StringIO()
-    console = Console(file=output, force_terminal=True, width=120)
+    format_pr_list(prs, console=rendered_console.console)
 
-    with patch("gitbrag.services.formatter.Console", return_value=console):
-        format_pr_list(prs)
-
-    result = output.getvalue()
+    result = rendered_console.text()
 
     # Check summary panel
     assert "Summary" in result
@@ -653,7 +521,7 @@ def test_format_pr_list_with_summary_statistics() -> None:
     assert "7" in result  # total files
 
 
-def test_format_pr_list_with_repo_roles() -> None:
+def test_format_pr_list_with_repo_roles(rendered_console: RenderedConsole) -> None:
     """Test PR list formatting displays repository roles."""
     prs = [
         PullRequestInfo(
@@ -689,13 +557,9 @@ def test_format_pr_list_with_repo_roles() -> None:
         "owner/repo2": "CONTRIBUTOR",
     }
 
-    output = StringIO()
-    console = Console(file=output, force_terminal=True, width=120)
-
-    with patch("gitbrag.services.formatter.Console", return_value=console):
-        format_pr_list(prs, repo_roles=repo_roles)
+    format_pr_list(prs, repo_roles=repo_roles, console=rendered_console.console)
 
-    result = output.getvalue()
+    result = rendered_console.text()
 
     # Check repository roles section in summary
     assert "Repository Roles" in result
@@ -1,7 +1,12 @@
 """Unit tests for task tracking service."""
 
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from types import MappingProxyType
+from typing import Any
+
 import pytest
-import pytest_asyncio
 
 from gitbrag.services.cache import configure_caches, get_cache
 from gitbrag.services.task_tracking import (
@@ -11,71 +16,97 @@ from gitbrag.services.task_tracking import (
     start_task,
 )
 
-
-@pytest_asyncio.fixture(autouse=True)
-async def setup_cache():
-    """Set up cache for all tests."""
-    configure_caches()
-    cache = get_cache("persistent")
-    await cache.clear()
-    yield
-    await cache.clear()
-
-
-@pytest.mark.asyncio
-async def test_start_task_succeeds_for_new_task():
-    """Test that starting a new task succeeds."""
-    task_id = "testuser:1_year:abc123"
-    metadata = {
+# Shared task metadata; tests copy it with their own reported username.
+DEFAULT_METADATA = MappingProxyType(
+    {
         "username": "testuser",
         "period": "1_year",
         "params_hash": "abc123",
         "started_at": 1234567890,
     }
+)
 
-    result = await start_task(task_id, metadata)
-    assert result is True
 
-    # Verify task key was created
-    cache = get_cache("persistent")
-    key = f"task:report:{task_id}"
-    task_data = await cache.get(key)
+@pytest.fixture(scope="module", autouse=True)
+def setup_cache():
+    """Configure caches once for the module.
+
+    Module rather than session scoped because other test modules reset the global
+    aiocache configuration between their tests.
+    """
+    configure_caches()
+
+
+async def _remove_reported_user_tasks(username: str) -> None:
+    """Complete every task registered for a reported user and drop their active-task list."""
+    for task_id in await get_reported_user_active_tasks(username):
+        await complete_task(task_id)
+    await get_cache("persistent").delete(f"task:user:{username}:active")
+
+
+@pytest.fixture
+async def reported_username(request: pytest.FixtureRequest) -> AsyncIterator[str]:
+    """Yield a reported username unique to the requesting test.
+
+    Task and per-user keys are namespaced by this name, so tests never see each
+    other's entries. The tasks a test registered are removed afterwards because the
+    persistent cache may be Redis, where keys outlive the test process.
+    """
+    username = request.node.name
+    yield username
+    await _remove_reported_user_tasks(username)
+
+
+@pytest.fixture
+async def reported_usernames(reported_username: str) -> AsyncIterator[tuple[str, str]]:
+    """Yield two distinct reported usernames derived from the test's own, removing their tasks afterwards."""
+    usernames = (f"{reported_username}-1", f"{reported_username}-2")
+    yield usernames
+    for username in usernames:
+        await _remove_reported_user_tasks(username)
+
+
+@pytest.fixture
+def unique_task_id(reported_username: str) -> str:
+    """Return a task id, in the service's ``{username}:{period}:{params_hash}`` format, unique to the test."""
+    return f"{reported_username}:1_year:abc123"
+
+
+async def _start_and_verify(task_id: str, metadata: dict[str, Any]) -> Any:
+    """Start a task, assert it was registered, and return its stored cache entry."""
+    assert await start_task(task_id, metadata) is True
+    task_data = await get_cache("persistent").get(f"task:report:{task_id}")
     assert task_data is not None
+    return task_data
 
 
 @pytest.mark.asyncio
-async def test_start_task_fails_for_duplicate_task():
-    """Test that starting a duplicate task fails (by checking existence first)."""
-    task_id = "testuser:1_year:abc123"
-    metadata = {
-        "username": "testuser",
-        "period": "1_year",
-        "params_hash": "abc123",
-        "started_at": 1234567890,
-    }
+async def test_start_task_succeeds_for_new_task(reported_username: str, unique_task_id: str):
+    """Test that starting a new task succeeds."""
+    task_id = unique_task_id
+    metadata = {**DEFAULT_METADATA, "username": reported_username}
 
-    # First call should succeed
-    result1 = await start_task(task_id, metadata)
-    assert result1 is True
+    task_data = await _start_and_verify(task_id, metadata)
+    assert json.loads(task_data) == metadata
 
-    # Verify task exists in cache
-    cache = get_cache("persistent")
-    key = f"task:report:{task_id}"
-    task_data = await cache.get(key)
-    assert task_data is not None
 
-    # Second call should detect existing key
-    # With SimpleMemoryCache, exists() may not work reliably, but get() will
-    # So the implementation checks exists() which may return False for SimpleMemoryCache
-    # Let's test that the key actually exists
-    exists = await cache.get(key) is not None
-    assert exists is True
+@pytest.mark.asyncio
+async def test_start_task_fails_for_duplicate_task(reported_username: str, unique_task_id: str):
+    """Test that starting a duplicate task fails."""
+    task_id = unique_task_id
+    metadata = {**DEFAULT_METADATA, "username": reported_username}
+
+    # First call should succeed
+    await _start_and_verify(task_id, metadata)
+
+    # Second call should detect the existing key and refuse to register again
+    assert await start_task(task_id, metadata) is False
 
 
 @pytest.mark.asyncio
-async def test_is_task_active_returns_correct_status():
+async def test_is_task_active_returns_correct_status(reported_username: str, unique_task_id: str):
     """Test that task existence can be verified."""
-    task_id = "testuser:1_year:abc123"
+    task_id = unique_task_id
     cache = get_cache("persistent")
     key = f"task:report:{task_id}"
 
@@ -83,37 +114,20 @@ async def test_is_task_active_returns_correct_status():
     task_data = await cache.get(key)
     assert task_data is None
 
-    # Start task
-    metadata = {
-        "username": "testuser",
-        "period": "1_year",
-        "params_hash": "abc123",
-        "started_at": 1234567890,
-    }
-    await start_task(task_id, metadata)
-
-    # Task should now exist
-    task_data = await cache.get(key)
-    assert task_data is not None
+    # Start task; it should now exist
+    metadata = {**DEFAULT_METADATA, "username": reported_username}
+    await _start_and_verify(task_id, metadata)
 
 
 @pytest.mark.asyncio
-async def test_complete_task_cleans_up_keys():
+async def test_complete_task_cleans_up_keys(reported_username: str, unique_task_id: str):
     """Test that complete_task cleans up cache keys."""
-    task_id = "testuser:1_year:abc123"
-    metadata = {
-        "username": "testuser",
-        "period": "1_year",
-        "params_hash": "abc123",
-        "started_at": 1234567890,
-    }
+    task_id = unique_task_id
+    metadata = {**DEFAULT_METADATA, "username": reported_username}
     cache = get_cache("persistent")
     key = f"task:report:{task_id}"
 
-    # Start task
-    await start_task(task_id, metadata)
-    task_data = await cache.get(key)
-    assert task_data is not None
+    await _start_and_verify(task_id, metadata)
 
     # Complete task
     await complete_task(task_id)
@@ -124,22 +138,17 @@ async def test_complete_task_cleans_up_keys():
 
 
 @pytest.mark.asyncio
-async def test_can_start_reported_user_task_enforces_limits():
+async def test_can_start_reported_user_task_enforces_limits(reported_username: str, unique_task_id: str):
     """Test that can_start_reported_user_task enforces per-reported-user limits."""
-    username = "testuser"
+    username = reported_username
 
     # Should be able to start first task
     can_start = await can_start_reported_user_task(username)
     assert can_start is True
 
     # Start first task
-    task_id1 = f"{username}:1_year:abc123"
-    metadata1 = {
-        "username": username,
-        "period": "1_year",
-        "params_hash": "abc123",
-        "started_at": 1234567890,
-    }
+    task_id1 = unique_task_id
+    metadata1 = {**DEFAULT_METADATA, "username": username}
     await start_task(task_id1, metadata1)
 
     # Verify user task list was created
@@ -153,60 +162,39 @@ async def test_can_start_reported_user_task_enforces_limits():
 
 
 @pytest.mark.asyncio
-async def test_different_reported_users_can_have_concurrent_tasks():
+async def test_different_reported_users_can_have_concurrent_tasks(reported_usernames: tuple[str, str]):
     """Test that different reported users can have concurrent tasks."""
-    user1 = "testuser1"
-    user2 = "testuser2"
-
-    # Start task for user1
+    user1, user2 = reported_usernames
     task_id1 = f"{user1}:1_year:abc123"
-    metadata1 = {
-        "username": user1,
-        "period": "1_year",
-        "params_hash": "abc123",
-        "started_at": 1234567890,
-    }
-    await start_task(task_id1, metadata1)
-
-    # Should still be able to start task for user2
-    can_start = await can_start_reported_user_task(user2)
-    assert can_start is True
-
-    # Start task for user2
     task_id2 = f"{user2}:1_year:abc123"
-    metadata2 = {
-        "username": user2,
-        "period": "1_year",
-        "params_hash": "abc123",
-        "started_at": 1234567890,
-    }
-    result = await start_task(task_id2, metadata2)
-    assert result is True
+    metadata1 = {**DEFAULT_METADATA, "username": user1}
+    metadata2 = {**DEFAULT_METADATA, "username": user2}
+
+    # Start both tasks concurrently; neither user's task should block the other
+    results = await asyncio.gather(start_task(task_id1, metadata1), start_task(task_id2, metadata2))
+    assert results == [True, True]
 
-    # Verify both users have active tasks
-    tasks1 = await get_reported_user_active_tasks(user1)
-    tasks2 = await get_reported_user_active_tasks(user2)
-    assert len(tasks1) >= 1
-    assert len(tasks2) >= 1
+    # Verify each user has only their own active task
+    tasks1, tasks2 = await asyncio.gather(
+        get_reported_user_active_tasks(user1),
+        get_reported_user_active_tasks(user2),
+    )
+    assert tasks1 == [task_id1]
+    assert tasks2 == [task_id2]
 
 
 @pytest.mark.asyncio
-async def test_get_reported_user_active_tasks():
+async def test_get_reported_user_active_tasks(reported_username: str, unique_task_id: str):
     """Test getting list of active tasks for a reported user."""
-    username = "testuser"
+    username = reported_username
 
     # Should have no active tasks initially
     tasks = await get_reported_user_active_tasks(username)
     assert len(tasks) == 0
 
     # Start a task
-    task_id = f"{username}:1_year:abc123"
-    metadata = {
-        "username": username,
-        "period": "1_year",
-        "params_hash": "abc123",
-        "started_at": 1234567890,
-    }
+    task_id = unique_task_id
+    metadata = {**DEFAULT_METADATA, "username": username}
     await start_task(task_id, metadata)
 
     # Should now have one active task
@@ -216,18 +204,13 @@ async def test_get_reported_user_active_tasks():
 
 
 @pytest.mark.asyncio
-async def test_same_reported_user_cannot_have_concurrent_tasks():
+async def test_same_reported_user_cannot_have_concurrent_tasks(reported_username: str, unique_task_id: str):
     """Test that same reported user cannot have multiple concurrent tasks."""
-    username = "testuser"
+    username = reported_username
 
     # Start first task
-    task_id1 = f"{username}:1_year:abc123"
-    metadata1 = {
-        "username": username,
-        "period": "1_year",
-        "params_hash": "abc123",
-        "started_at": 1234567890,
-    }
+    task_id1 = unique_task_id
+    metadata1 = {**DEFAULT_METADATA, "username": username}
     result1 = await start_task(task_id1, metadata1)
     assert result1 is True
 
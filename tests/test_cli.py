@@ -1,16 +1,33 @@
 """Tests for CLI application."""
 
 import asyncio
-from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from collections.abc import Callable, Coroutine
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import Any
 
 import pytest
-from typer.testing import CliRunner
+import typer
+from aiocache import caches
+from typer.testing import CliRunner, Result
 
-from gitbrag.cli import app, syncify
+from gitbrag import __version__
+from gitbrag.cli import _calculate_repo_roles, _parse_date, app, list_contributions, syncify
+from gitbrag.services.cache import configure_caches
 from gitbrag.services.github.models import PullRequestInfo
+from gitbrag.settings import settings
 
-runner = CliRunner()
+
+@pytest.fixture(scope="session")
+def help_result(runner: CliRunner) -> Result:
+    """Invoke ``--help`` once and share the result with tests that only read its output."""
+    return runner.invoke(app, ["--help"])
+
+
+@pytest.fixture(scope="session")
+def version_result(runner: CliRunner) -> Result:
+    """Invoke ``version`` once and share the result with tests that only read its output."""
+    return runner.invoke(app, ["version"])
 
 
 def test_cli_app_exists():
@@ -24,51 +41,36 @@ def test_cli_app_has_commands():
     assert hasattr(app, "registered_commands")
 
 
-def test_version_command_exists():
+def test_version_command_exists(help_result: Result):
     """Test that version command is registered."""
-    result = runner.invoke(app, ["--help"])
+    result = help_result
     assert result.exit_code == 0
     assert "version" in result.stdout.lower() or "full_test_project" in result.stdout.lower()
 
 
-def test_version_command_runs():
+def test_version_command_runs(version_result: Result):
     """Test that version command executes successfully."""
-    result = runner.invoke(app, ["version"])
+    result = version_result
     assert result.exit_code == 0
 
 
-def test_version_output_format():
+def test_version_output_format(version_result: Result):
     """Test that version command outputs correct format."""
-    from gitbrag.settings import settings
-
-    result = runner.invoke(app, ["version"])
-    assert settings.project_name in result.stdout
+    result = version_result
     # Should output: "project_name - X.Y.Z"
-    assert "-" in result.stdout
-
-
-def test_version_contains_version_number():
-    """Test that version output contains a version number."""
-    from gitbrag.settings import settings
+    assert result.stdout.strip() == f"{settings.project_name} - {__version__}"
 
-    result = runner.invoke(app, ["version"])
-    output = result.stdout.strip()
-    # Should contain project name and version
-    assert settings.project_name in output
 
-
-def test_help_flag():
+def test_help_flag(help_result: Result):
     """Test that --help flag works."""
-    from gitbrag.settings import settings
-
-    result = runner.invoke(app, ["--help"])
+    result = help_result
     assert result.exit_code == 0
     assert settings.project_name in result.stdout.lower() or "display" in result.stdout.lower()
 
 
-def test_help_shows_description():
+def test_help_shows_description(help_result: Result):
     """Test that help output shows description."""
-    result = runner.invoke(app, ["--help"])
+    result = help_result
     assert "version" in result.stdout.lower() or "display" in result.stdout.lower()
 
 
@@ -83,7 +85,7 @@ def test_syncify_converts_async_to_sync():
 
     @syncify
     async def test_async_func():
-        await asyncio.sleep(0.01)
+        await asyncio.sleep(0)
         return "success"
 
     # Should be able to call without await
@@ -107,7 +109,7 @@ def test_syncify_with_arguments():
 
     @syncify
     async def test_async_func(x, y):
-        await asyncio.sleep(0.01)
+        await asyncio.sleep(0)
         return x + y
 
     result = test_async_func(10, 20)
@@ -126,474 +128,368 @@ def test_syncify_preserves_function_name():
 
 def test_settings_imported():
     """Test that settings can be imported in CLI module."""
-    from gitbrag.settings import settings
-
     assert settings is not None
     assert hasattr(settings, "project_name")
 
 
-def test_version_uses_settings():
-    """Test that version command uses project_name from settings."""
-    from gitbrag.settings import settings
-
-    result = runner.invoke(app, ["version"])
-    assert settings.project_name in result.stdout
-
-
 # Tests for list command
 
 
-@pytest.fixture
-def mock_sample_prs() -> list[PullRequestInfo]:
-    """Create sample PRs for testing."""
-    return [
-        PullRequestInfo(
-            number=1,
-            title="Test PR 1",
-            repository="owner/repo",
-            url="https://github.com/owner/repo/pull/1",
-            state="open",
-            created_at=datetime(2024, 1, 1),
-            merged_at=None,
-            closed_at=None,
-            author="testuser",
-            organization="owner",
-        ),
-    ]
-
-
-def test_list_command_exists() -> None:
+def test_list_command_exists(help_result: Result) -> None:
     """Test that list command is registered."""
-    result = runner.invoke(app, ["--help"])
+    result = help_result
     assert result.exit_code == 0
     assert "list" in result.stdout.lower()
 
 
 def test_list_command_requires_username() -> None:
     """Test that list command requires username argument."""
-    result = runner.invoke(app, ["list"])
-    assert result.exit_code != 0
-
-
-@patch("gitbrag.cli.format_pr_list")
-@patch("gitbrag.cli.PullRequestCollector")
-@patch("gitbrag.cli.GitHubClient")
-def test_list_command_basic(
-    mock_client_class: MagicMock,
-    mock_collector_class: MagicMock,
-    mock_format: MagicMock,
-    mock_sample_prs: list[PullRequestInfo],
-) -> None:
-    """Test basic list command execution."""
-    # Mock GitHub client
-    mock_client_instance = MagicMock()
-    mock_github = MagicMock()
-    mock_client_instance.get_authenticated_client = AsyncMock(return_value=mock_github)
-    mock_client_class.return_value = mock_client_instance
+    # Only the exit code matters here, so call the app directly rather than through CliRunner.
+    with pytest.raises(SystemExit) as exc_info:
+        app(["list"], prog_name="gitbrag")
+    assert exc_info.value.code != 0
 
-    # Mock PR collector
-    mock_collector = MagicMock()
-    mock_collector.collect_user_prs = AsyncMock(return_value=mock_sample_prs)
-    mock_collector_class.return_value = mock_collector
 
-    result = runner.invoke(app, ["list", "testuser"])
-
-    assert result.exit_code == 0
-    mock_collector.collect_user_prs.assert_called_once()
-    mock_format.assert_called_once()
-
-
-@patch("gitbrag.cli.format_pr_list")
-@patch("gitbrag.cli.PullRequestCollector")
-@patch("gitbrag.cli.GitHubClient")
-def test_list_command_with_date_range(
-    mock_client_class: MagicMock,
-    mock_collector_class: MagicMock,
-    mock_format: MagicMock,
-    mock_sample_prs: list[PullRequestInfo],
-) -> None:
-    """Test list command with custom date range."""
-    mock_client_instance = MagicMock()
-    mock_github = MagicMock()
-    mock_client_instance.get_authenticated_client = AsyncMock(return_value=mock_github)
-    mock_client_class.return_value = mock_client_instance
-
-    mock_collector = MagicMock()
-    mock_collector.collect_user_prs = AsyncMock(return_value=mock_sample_prs)
-    mock_collector_class.return_value = mock_collector
-
-    result = runner.invoke(
-        app,
-        ["list", "testuser", "--since", "2024-01-01", "--until", "2024-12-31"],
-    )
+def _async_return(value: Any) -> Callable[..., Coroutine[Any, Any, Any]]:
+    """Return a coroutine function that ignores its arguments and returns ``value``."""
 
-    assert result.exit_code == 0
-    # Verify dates were passed to collector
-    call_kwargs = mock_collector.collect_user_prs.call_args.kwargs
-    assert "since" in call_kwargs
-    assert "until" in call_kwargs
-
-
-@patch("gitbrag.cli.format_pr_list")
-@patch("gitbrag.cli.PullRequestCollector")
-@patch("gitbrag.cli.GitHubClient")
-def test_list_command_include_private(
-    mock_client_class: MagicMock,
-    mock_collector_class: MagicMock,
-    mock_format: MagicMock,
-    mock_sample_prs: list[PullRequestInfo],
-) -> None:
-    """Test list command with --include-private flag."""
-    mock_client_instance = MagicMock()
-    mock_github = MagicMock()
-    mock_client_instance.get_authenticated_client = AsyncMock(return_value=mock_github)
-    mock_client_class.return_value = mock_client_instance
+    async def _return(*args: Any, **kwargs: Any) -> Any:
+        return value
 
-    mock_collector = MagicMock()
-    mock_collector.collect_user_prs = AsyncMock(return_value=mock_sample_prs)
-    mock_collector_class.return_value = mock_collector
+    return _return
 
-    result = runner.invoke(app, ["list", "testuser", "--include-private"])
 
-    assert result.exit_code == 0
-    call_kwargs = mock_collector.collect_user_prs.call_args.kwargs
-    assert call_kwargs["include_private"] is True
-
-
-@patch("gitbrag.cli.format_pr_list")
-@patch("gitbrag.cli.PullRequestCollector")
-@patch("gitbrag.cli.GitHubClient")
-def test_list_command_show_urls(
-    mock_client_class: MagicMock,
-    mock_collector_class: MagicMock,
-    mock_format: MagicMock,
-    mock_sample_prs: list[PullRequestInfo],
-) -> None:
-    """Test list command with --show-urls flag."""
-    mock_client_instance = MagicMock()
-    mock_github = MagicMock()
-    mock_client_instance.get_authenticated_client = AsyncMock(return_value=mock_github)
-    mock_client_class.return_value = mock_client_instance
+async def _raise_user_not_found(*args: Any, **kwargs: Any) -> list[PullRequestInfo]:
+    """Stand-in for collect_user_prs when the requested user does not exist."""
+    raise ValueError("User 'nonexistent' not found")
 
-    mock_collector = MagicMock()
-    mock_collector.collect_user_prs = AsyncMock(return_value=mock_sample_prs)
-    mock_collector_class.return_value = mock_collector
 
-    result = runner.invoke(app, ["list", "testuser", "--show-urls"])
+class _StubGitHub:
+    """Authenticated client stand-in; the list command only enters and exits it."""
 
-    assert result.exit_code == 0
-    call_kwargs = mock_format.call_args.kwargs
-    assert call_kwargs["show_urls"] is True
-
-
-@patch("gitbrag.cli.format_pr_list")
-@patch("gitbrag.cli.PullRequestCollector")
-@patch("gitbrag.cli.GitHubClient")
-def test_list_command_with_sort(
-    mock_client_class: MagicMock,
-    mock_collector_class: MagicMock,
-    mock_format: MagicMock,
-    mock_sample_prs: list[PullRequestInfo],
-) -> None:
-    """Test list command with --sort option."""
-    mock_client_instance = MagicMock()
-    mock_github = MagicMock()
-    mock_client_instance.get_authenticated_client = AsyncMock(return_value=mock_github)
-    mock_client_class.return_value = mock_client_instance
+    async def __aenter__(self) -> None:
+        return None
 
-    mock_collector = MagicMock()
-    mock_collector.collect_user_prs = AsyncMock(return_value=mock_sample_prs)
-    mock_collector_class.return_value = mock_collector
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
 
-    result = runner.invoke(app, ["list", "testuser", "--sort", "repository:asc"])
 
-    assert result.exit_code == 0
-    call_kwargs = mock_format.call_args.kwargs
-    assert "sort_fields" in call_kwargs
-    assert call_kwargs["sort_fields"] == [("repository", "asc")]
-
-
-@patch("gitbrag.cli.format_pr_list")
-@patch("gitbrag.cli.PullRequestCollector")
-@patch("gitbrag.cli.GitHubClient")
-def test_list_command_with_multiple_sort(
-    mock_client_class: MagicMock,
-    mock_collector_class: MagicMock,
-    mock_format: MagicMock,
-    mock_sample_prs: list[PullRequestInfo],
-) -> None:
-    """Test list command with multiple --sort flags."""
-    mock_client_instance = MagicMock()
-    mock_github = MagicMock()
-    mock_client_instance.get_authenticated_client = AsyncMock(return_value=mock_github)
-    mock_client_class.return_value = mock_client_instance
+@pytest.fixture
+def mocked_cli(monkeypatch: pytest.MonkeyPatch, mock_sample_prs: list[PullRequestInfo]) -> SimpleNamespace:
+    """Replace the list command's GitHub dependencies and formatter with recording stubs.
+
+    Returns a namespace with the keyword arguments each ``GitHubClient``,
+    ``collect_user_prs`` and ``format_pr_list`` call received. The collector returns
+    ``mock_sample_prs``.
+    """
+    calls = SimpleNamespace(client_kwargs=[], collector_kwargs=[], format_kwargs=[])
+
+    def stub_github_client(**kwargs: Any) -> SimpleNamespace:
+        calls.client_kwargs.append(kwargs)
+        return SimpleNamespace(get_authenticated_client=_async_return(_StubGitHub()))
+
+    class StubCollector:
+        def __init__(self, github: _StubGitHub) -> None:
+            pass
+
+        async def collect_user_prs(self, **kwargs: Any) -> list[PullRequestInfo]:
+            calls.collector_kwargs.append(kwargs)
+            return mock_sample_prs
+
+    def record_format(pull_requests: list[PullRequestInfo], **kwargs: Any) -> None:
+        calls.format_kwargs.append(kwargs)
+
+    monkeypatch.setattr("gitbrag.cli.GitHubClient", stub_github_client)
+    monkeypatch.setattr("gitbrag.cli.PullRequestCollector", StubCollector)
+    monkeypatch.setattr("gitbrag.cli.format_pr_list", record_format)
+    return calls
+
+
+def _list_command(**options: Any) -> None:
+    """Call the list command's Python callable directly, skipping Typer argument parsing.
+
+    Options not given take the command-line defaults.
+    """
+    defaults: dict[str, Any] = {
+        "username": "testuser",
+        "since": None,
+        "until": None,
+        "token": None,
+        "include_private": False,
+        "show_urls": False,
+        "show_star_increase": False,
+        "sort": None,
+    }
+    list_contributions(**{**defaults, **options})
 
-    mock_collector = MagicMock()
-    mock_collector.collect_user_prs = AsyncMock(return_value=mock_sample_prs)
-    mock_collector_class.return_value = mock_collector
 
+def test_list_command_end_to_end(runner: CliRunner, mocked_cli: SimpleNamespace) -> None:
+    """Test that every list command flag is parsed and passed through by Typer."""
     result = runner.invoke(
         app,
-        ["list", "testuser", "--sort", "repository", "--sort", "created:desc"],
+        [
+            "list",
+            "testuser",
+            "--since",
+            "2024-01-01",
+            "--until",
+            "2024-12-31",
+            "--token",
+            "custom_token",
+            "--include-private",
+            "--show-urls",
+            "--show-star-increase",
+            "--sort",
+            "repository",
+            "--sort",
+            "stars:asc",
+        ],
     )
 
     assert result.exit_code == 0
-    call_kwargs = mock_format.call_args.kwargs
-    sort_fields = call_kwargs["sort_fields"]
-    assert len(sort_fields) == 2
-    assert ("repository", "desc") in sort_fields
-    assert ("created_at", "desc") in sort_fields
+    assert mocked_cli.client_kwargs == [{"token_override": "custom_token"}]
+    assert mocked_cli.collector_kwargs == [
+        {
+            "username": "testuser",
+            "since": datetime(2024, 1, 1, tzinfo=timezone.utc),
+            "until": datetime(2024, 12, 31, tzinfo=timezone.utc),
+            "include_private": True,
+            "include_star_increase": True,
+        }
+    ]
+    [format_kwargs] = mocked_cli.format_kwargs
+    assert format_kwargs["show_urls"] is True
+    assert format_kwargs["sort_fields"] == [("repository", "desc"), ("stars", "asc")]
+
+
+@pytest.mark.parametrize(
+    ("options", "token", "collector_kwargs", "format_kwargs"),
+    [
+        pytest.param({}, None, {"username": "testuser"}, {"show_urls": False}, id="basic"),
+        pytest.param(
+            {"since": "2024-01-01", "until": "2024-12-31"},
+            None,
+            {
+                "since": datetime(2024, 1, 1, tzinfo=timezone.utc),
+                "until": datetime(2024, 12, 31, tzinfo=timezone.utc),
+            },
+            {},
+            id="date_range",
+        ),
+        pytest.param({"include_private": True}, None, {"include_private": True}, {}, id="include_private"),
+        pytest.param({"show_urls": True}, None, {}, {"show_urls": True}, id="show_urls"),
+        pytest.param({"sort": ["repository:asc"]}, None, {}, {"sort_fields": [("repository", "asc")]}, id="sort"),
+        pytest.param(
+            {"sort": ["repository", "created:desc"]},
+            None,
+            {},
+            {"sort_fields": [("repository", "desc"), ("created_at", "desc")]},
+            id="multiple_sort",
+        ),
+        pytest.param({"token": "custom_token"}, "custom_token", {}, {}, id="token_override"),
+        pytest.param(
+            {"include_private": True, "show_urls": True, "sort": ["repository:asc"]},
+            None,
+            {"include_private": True},
+            {"show_urls": True, "sort_fields": [("repository", "asc")]},
+            id="combined_flags",
+        ),
+    ],
+)
+def test_list_command_options(
+    mocked_cli: SimpleNamespace,
+    options: dict[str, Any],
+    token: str | None,
+    collector_kwargs: dict[str, Any],
+    format_kwargs: dict[str, Any],
+) -> None:
+    """Test that list command options reach the client, collector and formatter."""
+    _list_command(**options)
 
+    assert mocked_cli.client_kwargs == [{"token_override": token}]
 
-@patch("gitbrag.cli.GitHubClient")
-def test_list_command_invalid_sort_field(mock_client_class: MagicMock) -> None:
-    """Test list command with invalid sort field."""
-    result = runner.invoke(app, ["list", "testuser", "--sort", "invalid:asc"])
-    assert result.exit_code != 0
-    assert "Invalid sort field" in result.stdout
+    [actual_collector_kwargs] = mocked_cli.collector_kwargs
+    assert {key: actual_collector_kwargs[key] for key in collector_kwargs} == collector_kwargs
+    # Explicit and default dates alike reach the collector as UTC-aware datetimes
+    assert actual_collector_kwargs["since"].tzinfo == timezone.utc
+    assert actual_collector_kwargs["until"].tzinfo == timezone.utc
 
+    [actual_format_kwargs] = mocked_cli.format_kwargs
+    assert {key: actual_format_kwargs[key] for key in format_kwargs} == format_kwargs
 
-@patch("gitbrag.cli.GitHubClient")
-def test_list_command_invalid_sort_direction(mock_client_class: MagicMock) -> None:
-    """Test list command with invalid sort direction."""
-    result = runner.invoke(app, ["list", "testuser", "--sort", "repository:invalid"])
-    assert result.exit_code != 0
-    assert "Invalid sort direction" in result.stdout
-
-
-@patch("gitbrag.cli.format_pr_list")
-@patch("gitbrag.cli.PullRequestCollector")
-@patch("gitbrag.cli.GitHubClient")
-def test_list_command_with_token_override(
-    mock_client_class: MagicMock,
-    mock_collector_class: MagicMock,
-    mock_format: MagicMock,
-    mock_sample_prs: list[PullRequestInfo],
-) -> None:
-    """Test list command with --token override."""
-    mock_client_instance = MagicMock()
-    mock_github = MagicMock()
-    mock_client_instance.get_authenticated_client = AsyncMock(return_value=mock_github)
-    mock_client_class.return_value = mock_client_instance
 
-    mock_collector = MagicMock()
-    mock_collector.collect_user_prs = AsyncMock(return_value=mock_sample_prs)
-    mock_collector_class.return_value = mock_collector
+def test_list_command_invalid_sort_field(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test list command with invalid sort field."""
+    with pytest.raises(typer.Exit) as exc_info:
+        _list_command(sort=["invalid:asc"])
+    assert exc_info.value.exit_code == 1
+    assert "Invalid sort field" in capsys.readouterr().out
 
-    result = runner.invoke(app, ["list", "testuser", "--token", "custom_token"])
 
-    assert result.exit_code == 0
-    # Verify token override was passed to GitHubClient
-    mock_client_class.assert_called_once_with(token_override="custom_token")
+def test_list_command_invalid_sort_direction(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test list command with invalid sort direction."""
+    with pytest.raises(typer.Exit) as exc_info:
+        _list_command(sort=["repository:invalid"])
+    assert exc_info.value.exit_code == 1
+    assert "Invalid sort direction" in capsys.readouterr().out
 
 
-def test_list_command_invalid_date_format() -> None:
+def test_list_command_invalid_date_format(capsys: pytest.CaptureFixture[str]) -> None:
     """Test list command with invalid date format."""
-    result = runner.invoke(app, ["list", "testuser", "--since", "not-a-date"])
-    assert result.exit_code != 0
-    assert "Invalid date format" in result.stdout
+    with pytest.raises(typer.Exit) as exc_info:
+        _list_command(since="not-a-date")
+    assert exc_info.value.exit_code == 1
+    assert "Invalid date format" in capsys.readouterr().out
 
 
-@patch("gitbrag.cli.GitHubClient")
-def test_list_command_since_after_until(mock_client_class: MagicMock) -> None:
+def test_list_command_since_after_until(capsys: pytest.CaptureFixture[str]) -> None:
     """Test list command with --since date after --until date."""
-    result = runner.invoke(
-        app,
-        ["list", "testuser", "--since", "2024-12-31", "--until", "2024-01-01"],
-    )
-    assert result.exit_code != 0
-    assert "--since date must be before --until date" in result.stdout
+    with pytest.raises(typer.Exit) as exc_info:
+        _list_command(since="2024-12-31", until="2024-01-01")
+    assert exc_info.value.exit_code == 1
+    assert "--since date must be before --until date" in capsys.readouterr().out
 
 
-@patch("gitbrag.cli.PullRequestCollector")
-@patch("gitbrag.cli.GitHubClient")
 def test_list_command_user_not_found(
-    mock_client_class: MagicMock,
-    mock_collector_class: MagicMock,
+    mocked_cli: SimpleNamespace, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
 ) -> None:
     """Test list command with non-existent user."""
-    mock_client_instance = MagicMock()
-    mock_github = MagicMock()
-    mock_client_instance.get_authenticated_client = AsyncMock(return_value=mock_github)
-    mock_client_class.return_value = mock_client_instance
-
-    mock_collector = MagicMock()
-    mock_collector.collect_user_prs = AsyncMock(side_effect=ValueError("User 'nonexistent' not found"))
-    mock_collector_class.return_value = mock_collector
-
-    result = runner.invoke(app, ["list", "nonexistent"])
-
-    assert result.exit_code != 0
-    assert "User 'nonexistent' not found" in result.stdout
-
-
-@patch("gitbrag.cli.format_pr_list")
-@patch("gitbrag.cli.PullRequestCollector")
-@patch("gitbrag.cli.GitHubClient")
-def test_list_command_combined_flags(
-    mock_client_class: MagicMock,
-    mock_collector_class: MagicMock,
-    mock_format: MagicMock,
-    mock_sample_prs: list[PullRequestInfo],
-) -> None:
-    """Test list command with multiple flags combined."""
-    mock_client_instance = MagicMock()
-    mock_github = MagicMock()
-    mock_client_instance.get_authenticated_client = AsyncMock(return_value=mock_github)
-    mock_client_class.return_value = mock_client_instance
-
-    mock_collector = MagicMock()
-    mock_collector.collect_user_prs = AsyncMock(return_value=mock_sample_prs)
-    mock_collector_class.return_value = mock_collector
-
-    result = runner.invoke(
-        app,
-        ["list", "testuser", "--include-private", "--show-urls", "--sort", "repository:asc"],
+    monkeypatch.setattr(
+        "gitbrag.cli.PullRequestCollector",
+        lambda github: SimpleNamespace(collect_user_prs=_raise_user_not_found),
     )
 
-    assert result.exit_code == 0
-
-    collector_kwargs = mock_collector.collect_user_prs.call_args.kwargs
-    assert collector_kwargs["include_private"] is True
-
-    format_kwargs = mock_format.call_args.kwargs
-    assert format_kwargs["show_urls"] is True
-    assert format_kwargs["sort_fields"] == [("repository", "asc")]
+    with pytest.raises(typer.Exit) as exc_info:
+        _list_command(username="nonexistent")
 
+    assert exc_info.value.exit_code == 1
+    assert "User 'nonexistent' not found" in capsys.readouterr().out
 
-def test_cache_configured_on_cli_import() -> None:
-    """Test that caches are configured when CLI module is imported."""
-    from aiocache import caches
 
-    # Re-configure caches by calling configure_caches directly
-    # (since cli module might already be imported and cached)
-    from gitbrag.services.cache import configure_caches
+@pytest.fixture(scope="session")
+def _cache_configured() -> Any:
+    """Configure caches once per session and return the aiocache registry.
 
+    The CLI module configures caches on import, but it may have been imported (and the
+    configuration reset by the cache tests) long before this runs, so configure again here.
+    """
     configure_caches()
+    return caches
+
 
+def test_cache_configured_on_cli_import(_cache_configured: Any) -> None:
+    """Test that the CLI's cache aliases are configured and usable."""
     # Verify that cache aliases are configured
-    cache_config = caches.get_config()
+    cache_config = _cache_configured.get_config()
     assert "default" in cache_config
     assert "memory" in cache_config
     assert "persistent" in cache_config
 
     # Verify we can get each cache without error
-    default_cache = caches.get("default")
-    assert default_cache is not None
-
-    memory_cache = caches.get("memory")
-    assert memory_cache is not None
-
-    persistent_cache = caches.get("persistent")
-    assert persistent_cache is not None
-
-
-def test_parse_date_returns_timezone_aware() -> None:
-    """Test that _parse_date returns timezone-aware datetimes."""
-    from datetime import timezone
-
-    from gitbrag.cli import _parse_date
-
-    # Test with None (default)
-    default_date = _parse_date(None, default_days_ago=365)
-    assert default_date.tzinfo is not None
-    assert default_date.tzinfo == timezone.utc
-
-    # Test with ISO string (naive)
-    parsed_date = _parse_date("2024-12-15", default_days_ago=0)
-    assert parsed_date.tzinfo is not None
-    assert parsed_date.tzinfo == timezone.utc
-
-    # Test with ISO string (aware)
-    parsed_aware = _parse_date("2024-12-15T10:30:00+00:00", default_days_ago=0)
-    assert parsed_aware.tzinfo is not None
-
-
-def test_parse_date_naive_assumed_utc() -> None:
-    """Test that naive date strings are assumed to be UTC."""
-    from datetime import timezone
-
-    from gitbrag.cli import _parse_date
-
-    parsed = _parse_date("2024-12-15T10:30:00", default_days_ago=0)
+    for alias in ("default", "memory", "persistent"):
+        assert _cache_configured.get(alias) is not None
+
+
+@pytest.mark.parametrize(
+    ("date_str", "expected"),
+    [
+        pytest.param("2024-12-15", datetime(2024, 12, 15, tzinfo=timezone.utc), id="date_only"),
+        pytest.param("2024-12-15T10:30:00", datetime(2024, 12, 15, 10, 30, tzinfo=timezone.utc), id="naive"),
+        pytest.param("2024-12-15T10:30:00+00:00", datetime(2024, 12, 15, 10, 30, tzinfo=timezone.utc), id="aware"),
+        pytest.param("2024-12-15T10:30:00Z", datetime(2024, 12, 15, 10, 30, tzinfo=timezone.utc), id="zulu"),
+    ],
+)
+def test_parse_date_returns_utc(date_str: str, expected: datetime) -> None:
+    """Test that _parse_date returns UTC datetimes, assuming UTC for naive strings."""
+    parsed = _parse_date(date_str, default_days_ago=0)
+    assert parsed == expected
     assert parsed.tzinfo == timezone.utc
-    assert parsed.year == 2024
-    assert parsed.month == 12
-    assert parsed.day == 15
-    assert parsed.hour == 10
-    assert parsed.minute == 30
-
-
-@patch("gitbrag.cli.format_pr_list")
-@patch("gitbrag.cli.PullRequestCollector")
-@patch("gitbrag.cli.GitHubClient")
-def test_list_command_dates_are_timezone_aware(
-    mock_client_class: MagicMock,
-    mock_collector_class: MagicMock,
-    mock_format: MagicMock,
-    mock_sample_prs: list[PullRequestInfo],
-) -> None:
-    """Test that dates passed to collector are timezone-aware."""
-    from datetime import timezone
-
-    mock_client_instance = MagicMock()
-    mock_github = MagicMock()
-    mock_client_instance.get_authenticated_client = AsyncMock(return_value=mock_github)
-    mock_client_class.return_value = mock_client_instance
-
-    mock_collector = MagicMock()
-    mock_collector.collect_user_prs = AsyncMock(return_value=mock_sample_prs)
-    mock_collector_class.return_value = mock_collector
-
-    result = runner.invoke(app, ["list", "testuser", "--since", "2024-01-01", "--until", "2024-12-31"])
-
-    assert result.exit_code == 0
 
-    # Verify dates passed to collector are timezone-aware
-    collector_kwargs = mock_collector.collect_user_prs.call_args.kwargs
-    since_date = collector_kwargs["since"]
-    until_date = collector_kwargs["until"]
 
-    assert since_date.tzinfo is not None
-    assert since_date.tzinfo == timezone.utc
-    assert until_date.tzinfo is not None
-    assert until_date.tzinfo == timezone.utc
+def test_parse_date_default_is_utc_days_ago() -> None:
+    """Test that _parse_date defaults to a UTC datetime the given number of days ago."""
+    expected = datetime.now(timezone.utc) - timedelta(days=365)
+    parsed = _parse_date(None, default_days_ago=365)
+    assert parsed.tzinfo == timezone.utc
+    assert abs(parsed - expected) < timedelta(minutes=1)
+
+
+# Dates and read-only pull requests for the _calculate_repo_roles tests.
+_D1 = datetime(2024, 1, 1)
+_D2 = datetime(2024, 1, 2)
+_D3 = datetime(2024, 1, 3)
+_D6 = datetime(2024, 6, 1)
+
+_OWNER_PR = PullRequestInfo(
+    number=1,
+    title="PR 1",
+    repository="owner/repo1",
+    url="https://github.com/owner/repo1/pull/1",
+    state="open",
+    created_at=_D1,
+    merged_at=None,
+    closed_at=None,
+    author="testuser",
+    organization="owner",
+    author_association="OWNER",
+)
+_CONTRIBUTOR_PR = PullRequestInfo(
+    number=2,
+    title="PR 2",
+    repository="owner/repo2",
+    url="https://github.com/owner/repo2/pull/2",
+    state="merged",
+    created_at=_D2,
+    merged_at=_D3,
+    closed_at=_D3,
+    author="testuser",
+    organization="owner",
+    author_association="CONTRIBUTOR",
+)
+_OLDER_CONTRIBUTOR_PR = PullRequestInfo(
+    number=1,
+    title="Older PR",
+    repository="owner/repo",
+    url="https://github.com/owner/repo/pull/1",
+    state="merged",
+    created_at=_D1,
+    merged_at=_D2,
+    closed_at=_D2,
+    author="testuser",
+    organization="owner",
+    author_association="CONTRIBUTOR",
+)
+_NEWER_MEMBER_PR = PullRequestInfo(
+    number=2,
+    title="Newer PR",
+    repository="owner/repo",
+    url="https://github.com/owner/repo/pull/2",
+    state="open",
+    created_at=_D6,
+    merged_at=None,
+    closed_at=None,
+    author="testuser",
+    organization="owner",
+    author_association="MEMBER",
+)
+_NO_ROLE_PR = PullRequestInfo(
+    number=1,
+    title="PR without role",
+    repository="owner/repo",
+    url="https://github.com/owner/repo/pull/1",
+    state="open",
+    created_at=_D1,
+    merged_at=None,
+    closed_at=None,
+    author="testuser",
+    organization="owner",
+    author_association=None,
+)
 
 
 def test_calculate_repo_roles_basic():
     """Test calculating repository roles from PRs."""
-    from gitbrag.cli import _calculate_repo_roles
-
-    prs = [
-        PullRequestInfo(
-            number=1,
-            title="PR 1",
-            repository="owner/repo1",
-            url="https://github.com/owner/repo1/pull/1",
-            state="open",
-            created_at=datetime(2024, 1, 1),
-            merged_at=None,
-            closed_at=None,
-            author="testuser",
-            organization="owner",
-            author_association="OWNER",
-        ),
-        PullRequestInfo(
-            number=2,
-            title="PR 2",
-            repository="owner/repo2",
-            url="https://github.com/owner/repo2/pull/2",
-            state="merged",
-            created_at=datetime(2024, 1, 2),
-            merged_at=datetime(2024, 1, 3),
-            closed_at=datetime(2024, 1, 3),
-            author="testuser",
-            organization="owner",
-            author_association="CONTRIBUTOR",
-        ),
-    ]
-
-    repo_roles = _calculate_repo_roles(prs)
+    repo_roles = _calculate_repo_roles([_OWNER_PR, _CONTRIBUTOR_PR])
 
     assert repo_roles == {
         "owner/repo1": "OWNER",
@@ -603,38 +499,7 @@ def test_calculate_repo_roles_basic():
 
 def test_calculate_repo_roles_uses_most_recent():
     """Test that _calculate_repo_roles uses the most recent PR for each repo."""
-    from gitbrag.cli import _calculate_repo_roles
-
-    prs = [
-        PullRequestInfo(
-            number=1,
-            title="Older PR",
-            repository="owner/repo",
-            url="https://github.com/owner/repo/pull/1",
-            state="merged",
-            created_at=datetime(2024, 1, 1),
-            merged_at=datetime(2024, 1, 2),
-            closed_at=datetime(2024, 1, 2),
-            author="testuser",
-            organization="owner",
-            author_association="CONTRIBUTOR",
-        ),
-        PullRequestInfo(
-            number=2,
-            title="Newer PR",
-            repository="owner/repo",
-            url="https://github.com/owner/repo/pull/2",
-            state="open",
-            created_at=datetime(2024, 6, 1),
-            merged_at=None,
-            closed_at=None,
-            author="testuser",
-            organization="owner",
-            author_association="MEMBER",
-        ),
-    ]
-
-    repo_roles = _calculate_repo_roles(prs)
+    repo_roles = _calculate_repo_roles([_OLDER_CONTRIBUTOR_PR, _NEWER_MEMBER_PR])
 
     # Should use MEMBER from the newer PR
     assert repo_roles == {"owner/repo": "MEMBER"}
@@ -642,24 +507,6 @@ def test_calculate_repo_roles_uses_most_recent():
 
 def test_calculate_repo_roles_handles_none():
     """Test that _calculate_repo_roles handles None author_association."""
-    from gitbrag.cli import _calculate_repo_roles
-
-    prs = [
-        PullRequestInfo(
-            number=1,
-            title="PR without role",
-            repository="owner/repo",
-            url="https://github.com/owner/repo/pull/1",
-            state="open",
-            created_at=datetime(2024, 1, 1),
-            merged_at=None,
-            closed_at=None,
-            author="testuser",
-            organization="owner",
-            author_association=None,
-        ),
-    ]
-
-    repo_roles = _calculate_repo_roles(prs)
+    repo_roles = _calculate_repo_roles([_NO_ROLE_PR])
 
     assert repo_roles == {"owner/repo": None}
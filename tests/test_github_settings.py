@@ -1,28 +1,25 @@
+from typing import Any
+
 import pytest
 from pydantic import SecretStr, ValidationError
 
 from gitbrag.conf.github import GitHubAuthType, GitHubSettings
 
 
-def test_pat_configuration_valid() -> None:
-    """Test valid PAT authentication configuration."""
-    settings = GitHubSettings(
+@pytest.fixture(scope="module")
+def default_settings() -> GitHubSettings:
+    """PAT settings with no other overrides, shared read-only across the module."""
+    return GitHubSettings(
         github_auth_type=GitHubAuthType.PAT,
-        github_token=SecretStr("test_token_123"),
+        github_token=SecretStr("test_token"),
     )
-    assert settings.github_auth_type == GitHubAuthType.PAT
-    assert settings.github_token is not None
-    assert settings.github_token.get_secret_value() == "test_token_123"
 
 
-def test_pat_configuration_missing_token() -> None:
-    """Test PAT configuration fails without token."""
-    with pytest.raises(ValidationError, match="github_token is required"):
-        GitHubSettings(
-            github_auth_type=GitHubAuthType.PAT,
-            github_token=None,
-            github_validate_on_init=True,
-        )
+def test_pat_configuration_valid(default_settings: GitHubSettings) -> None:
+    """Test valid PAT authentication configuration."""
+    assert default_settings.github_auth_type == GitHubAuthType.PAT
+    assert default_settings.github_token is not None
+    assert default_settings.github_token.get_secret_value() == "test_token"
 
 
 def test_github_app_configuration_valid() -> None:
@@ -38,64 +35,64 @@ def test_github_app_configuration_valid() -> None:
     assert settings.github_app_client_secret.get_secret_value() == "test_client_secret"
 
 
-def test_github_app_configuration_missing_client_id() -> None:
-    """Test GitHub App configuration fails without client ID."""
-    with pytest.raises(ValidationError, match="github_app_client_id is required"):
-        GitHubSettings(
-            github_auth_type=GitHubAuthType.GITHUB_APP,
-            github_app_client_id=None,
-            github_app_client_secret=SecretStr("test_secret"),
-            github_validate_on_init=True,
-        )
-
-
-def test_github_app_configuration_missing_client_secret() -> None:
-    """Test GitHub App configuration fails without client secret."""
-    with pytest.raises(ValidationError, match="github_app_client_secret is required"):
-        GitHubSettings(
-            github_auth_type=GitHubAuthType.GITHUB_APP,
-            github_app_client_id="test_id",
-            github_app_client_secret=None,
-            github_validate_on_init=True,
-        )
-
-
-def test_oauth_callback_port_default() -> None:
+@pytest.mark.parametrize(
+    ("kwargs", "error_match"),
+    [
+        pytest.param(
+            {"github_auth_type": GitHubAuthType.PAT, "github_token": None},
+            "github_token is required",
+            id="pat_missing_token",
+        ),
+        pytest.param(
+            {
+                "github_auth_type": GitHubAuthType.GITHUB_APP,
+                "github_app_client_id": None,
+                "github_app_client_secret": SecretStr("test_secret"),
+            },
+            "github_app_client_id is required",
+            id="github_app_missing_client_id",
+        ),
+        pytest.param(
+            {
+                "github_auth_type": GitHubAuthType.GITHUB_APP,
+                "github_app_client_id": "test_id",
+                "github_app_client_secret": None,
+            },
+            "github_app_client_secret is required",
+            id="github_app_missing_client_secret",
+        ),
+    ],
+)
+def test_configuration_missing_required_field(kwargs: dict[str, Any], error_match: str) -> None:
+    """Test that each auth type fails validation without its required credentials."""
+    with pytest.raises(ValidationError, match=error_match):
+        GitHubSettings(**kwargs, github_validate_on_init=True)
+
+
+def test_oauth_callback_port_default(default_settings: GitHubSettings) -> None:
     """Test default OAuth callback port."""
-    settings = GitHubSettings(
-        github_auth_type=GitHubAuthType.PAT,
-        github_token=SecretStr("test_token"),
-    )
-    assert settings.github_oauth_callback_port == 8080
+    assert default_settings.github_oauth_callback_port == 8080
 
 
-def test_oauth_callback_port_custom() -> None:
-    """Test custom OAuth callback port."""
+@pytest.mark.parametrize("port", [1024, 9000, 65535])
+def test_oauth_callback_port_valid(port: int) -> None:
+    """Test custom OAuth callback ports within 1024-65535 are accepted."""
     settings = GitHubSettings(
         github_auth_type=GitHubAuthType.PAT,
         github_token=SecretStr("test_token"),
-        github_oauth_callback_port=9000,
+        github_oauth_callback_port=port,
     )
-    assert settings.github_oauth_callback_port == 9000
-
-
-def test_oauth_callback_port_invalid_low() -> None:
-    """Test OAuth callback port validation rejects ports below 1024."""
-    with pytest.raises(ValidationError, match="OAuth callback port must be between 1024 and 65535"):
-        GitHubSettings(
-            github_auth_type=GitHubAuthType.PAT,
-            github_token=SecretStr("test_token"),
-            github_oauth_callback_port=80,
-        )
+    assert settings.github_oauth_callback_port == port
 
 
-def test_oauth_callback_port_invalid_high() -> None:
-    """Test OAuth callback port validation rejects ports above 65535."""
+@pytest.mark.parametrize("port", [80, 1023, 65536, 70000])
+def test_oauth_callback_port_invalid(port: int) -> None:
+    """Test OAuth callback port validation rejects ports outside 1024-65535."""
     with pytest.raises(ValidationError, match="OAuth callback port must be between 1024 and 65535"):
         GitHubSettings(
             github_auth_type=GitHubAuthType.PAT,
             github_token=SecretStr("test_token"),
-            github_oauth_callback_port=70000,
+            github_oauth_callback_port=port,
         )
 
 
@@ -1,10 +1,26 @@
 """Tests for settings configuration."""
 
+import pytest
+
 from gitbrag.conf.cache import CacheSettings
 from gitbrag.conf.settings import Settings
 from gitbrag.settings import settings
 
 
+@pytest.fixture(scope="module", autouse=True)
+def _disable_dotenv():
+    """Keep a developer's local .env file out of the Settings these tests build."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("pydantic_settings.sources.DotEnvSettingsSource.__call__", lambda *args, **kwargs: {})
+        yield
+
+
+@pytest.fixture(scope="module")
+def default_settings() -> Settings:
+    """A Settings instance built once for tests that read defaults without changing the environment."""
+    return Settings()
+
+
 def test_settings_exists():
     """Test that settings instance exists."""
     assert settings is not None
@@ -38,11 +54,10 @@ def test_settings_inherits_from_cache_settings():
     assert issubclass(Settings, CacheSettings)
 
 
-def test_settings_can_be_instantiated():
+def test_settings_can_be_instantiated(default_settings: Settings):
     """Test that Settings can be instantiated."""
-    test_settings = Settings()
-    assert test_settings is not None
-    assert isinstance(test_settings, Settings)
+    assert default_settings is not None
+    assert isinstance(default_settings, Settings)
 
 
 def test_cache_settings_exists():
@@ -67,10 +82,9 @@ def test_cache_redis_port_attribute():
     assert isinstance(settings.cache_redis_port, int)
 
 
-def test_cache_redis_port_default():
+def test_cache_redis_port_default(default_settings: Settings):
     """Test that cache_redis_port defaults to 6379."""
-    test_settings = Settings()
-    assert test_settings.cache_redis_port == 6379
+    assert default_settings.cache_redis_port == 6379
 
 
 def test_cache_default_ttl_attribute():
@@ -79,9 +93,9 @@ def test_cache_default_ttl_attribute():
     assert isinstance(settings.cache_default_ttl, int)
 
 
-def test_cache_default_ttl_value():
+def test_cache_default_ttl_value(default_settings: Settings):
     """Test that cache_default_ttl has reasonable default."""
-    assert settings.cache_default_ttl == 300  # 5 minutes
+    assert default_settings.cache_default_ttl == 300  # 5 minutes
 
 
 def test_cache_persistent_ttl_attribute():
@@ -90,15 +104,14 @@ def test_cache_persistent_ttl_attribute():
     assert isinstance(settings.cache_persistent_ttl, int)
 
 
-def test_cache_persistent_ttl_value():
+def test_cache_persistent_ttl_value(default_settings: Settings):
     """Test that cache_persistent_ttl has reasonable default."""
-    assert settings.cache_persistent_ttl == 3600  # 1 hour
+    assert default_settings.cache_persistent_ttl == 3600  # 1 hour
 
 
-def test_debug_defaults_to_false():
+def test_debug_defaults_to_false(default_settings: Settings):
     """Test that debug defaults to False."""
-    test_settings = Settings()
-    assert test_settings.debug is False
+    assert default_settings.debug is False
 
 
 def test_all_required_attributes_present():
@@ -117,12 +130,11 @@ def test_all_required_attributes_present():
         assert hasattr(settings, attr), f"Missing attribute: {attr}"
 
 
-def test_settings_can_load_from_env():
+def test_settings_can_load_from_env(default_settings: Settings):
     """Test that settings can be overridden by environment variables."""
     # This tests that the Settings class is properly configured
     # to load from environment variables using pydantic-settings
-    test_settings = Settings()
-    assert hasattr(test_settings, "model_config") or hasattr(test_settings, "Config")
+    assert hasattr(default_settings, "model_config") or hasattr(default_settings, "Config")
 
 
 def test_cache_enabled_from_env(monkeypatch):
@@ -153,15 +165,14 @@ def test_cache_redis_port_from_env(monkeypatch):
     assert test_settings.cache_redis_port == 6380
 
 
-def test_settings_validates_types():
+def test_settings_validates_types(default_settings: Settings):
     """Test that settings validates types correctly."""
     # This is implicitly tested by pydantic, but we verify it works
-    test_settings = Settings()
-    assert isinstance(test_settings.debug, bool)
-    assert isinstance(test_settings.cache_enabled, bool)
-    assert isinstance(test_settings.cache_redis_port, int)
-    assert isinstance(test_settings.cache_default_ttl, int)
-    assert isinstance(test_settings.cache_star_increase_ttl, int)
+    assert isinstance(default_settings.debug, bool)
+    assert isinstance(default_settings.cache_enabled, bool)
+    assert isinstance(default_settings.cache_redis_port, int)
+    assert isinstance(default_settings.cache_default_ttl, int)
+    assert isinstance(default_settings.cache_star_increase_ttl, int)
 
 
 def test_cache_star_increase_ttl_attribute():
@@ -170,10 +181,9 @@ def test_cache_star_increase_ttl_attribute():
     assert isinstance(settings.cache_star_increase_ttl, int)
 
 
-def test_cache_star_increase_ttl_value():
+def test_cache_star_increase_ttl_value(default_settings: Settings):
     """Test that cache_star_increase_ttl has the correct default value."""
-    test_settings = Settings()
-    assert test_settings.cache_star_increase_ttl == 86400  # 24 hours
+    assert default_settings.cache_star_increase_ttl == 86400  # 24 hours
 
 
 def test_enable_plausible_attribute():
@@ -185,8 +195,6 @@ def test_enable_plausible_attribute():
 def test_enable_plausible_defaults_to_false(monkeypatch):
     """Test that enable_plausible defaults to False."""
     monkeypatch.delenv("ENABLE_PLAUSIBLE", raising=False)
-    # Prevent loading from .env file
-    monkeypatch.setattr("pydantic_settings.sources.DotEnvSettingsSource.__call__", lambda *args, **kwargs: {})
     test_settings = Settings()
     assert test_settings.enable_plausible is False
 
@@ -206,8 +214,6 @@ def test_plausible_script_hash_attribute():
 def test_plausible_script_hash_defaults_to_none(monkeypatch):
     """Test that plausible_script_hash defaults to None."""
     monkeypatch.delenv("PLAUSIBLE_SCRIPT_HASH", raising=False)
-    # Prevent loading from .env file
-    monkeypatch.setattr("pydantic_settings.sources.DotEnvSettingsSource.__call__", lambda *args, **kwargs: {})
     test_settings = Settings()
     assert test_settings.plausible_script_hash is None
 
@@ -1,11 +1,32 @@
 """Tests for FastAPI web application."""
 
+import os
+
 import pytest
+from fastapi.testclient import TestClient
 
 from gitbrag.settings import settings
 from gitbrag.www import app
 
 
+@pytest.fixture(scope="module")
+def home_response():
+    """Fetch the home page once and share the response with tests that only inspect it.
+
+    Uses its own client so the shared function-scoped ``fastapi_client`` keeps its per-test
+    cookie jar.
+    """
+    return TestClient(app).get("/")
+
+
+@pytest.fixture(scope="module")
+def user_report_template():
+    """Read the raw user_report.html template source once for the template content tests."""
+    template_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "gitbrag", "templates", "user_report.html")
+    with open(template_path) as f:
+        return f.read()
+
+
 def test_app_exists():
     """Test that the FastAPI app is properly instantiated."""
     assert app is not None
@@ -18,9 +39,9 @@ def test_static_files_mounted():
     assert "/static" in routes or any("/static" in route for route in routes)
 
 
-def test_home_page(fastapi_client):
+def test_home_page(home_response):
     """Test that home page is accessible."""
-    response = fastapi_client.get("/")
+    response = home_response
     assert response.status_code == 200
     assert "text/html" in response.headers.get("content-type", "")
     assert b"git brag" in response.content
@@ -37,7 +58,7 @@ def test_login_route_exists(fastapi_client):
     # Should redirect to GitHub OAuth
     assert response.status_code in (302, 307)
     location = response.headers.get("location", "")
-    assert location.startswith("https://github.com/") or location.startswith("http://github.com/")
+    assert location.startswith("https://github.com/")
 
 
 def test_logout_route(fastapi_client):
@@ -85,15 +106,15 @@ def test_app_can_start(fastapi_client):
     assert response.status_code == 200
 
 
-def test_basic_health(fastapi_client):
+def test_basic_health(home_response):
     """Test basic application health by accessing root."""
-    response = fastapi_client.get("/")
+    response = home_response
     assert response.status_code in [200, 307], "App should respond to requests"
 
 
-def test_basic_meta_tags(fastapi_client):
+def test_basic_meta_tags(home_response):
     """Test that basic meta tags are present in HTML."""
-    response = fastapi_client.get("/")
+    response = home_response
     assert response.status_code == 200
     content = response.content.decode()
     assert '<meta name="description"' in content
@@ -101,9 +122,9 @@ def test_basic_meta_tags(fastapi_client):
     assert '<meta name="keywords"' in content
 
 
-def test_open_graph_metadata(fastapi_client):
+def test_open_graph_metadata(home_response):
     """Test that Open Graph metadata is present in HTML."""
-    response = fastapi_client.get("/")
+    response = home_response
     assert response.status_code == 200
     content = response.content.decode()
     assert '<meta property="og:type"' in content
@@ -113,9 +134,9 @@ def test_open_graph_metadata(fastapi_client):
     assert '<meta property="og:image"' in content
 
 
-def test_twitter_card_metadata(fastapi_client):
+def test_twitter_card_metadata(home_response):
     """Test that Twitter Card metadata is present in HTML."""
-    response = fastapi_client.get("/")
+    response = home_response
     assert response.status_code == 200
     content = response.content.decode()
     assert '<meta name="twitter:card" content="summary_large_image"' in content
@@ -124,20 +145,20 @@ def test_twitter_card_metadata(fastapi_client):
     assert '<meta name="twitter:image"' in content
 
 
-def test_plausible_script_not_injected_by_default(fastapi_client):
+def test_plausible_script_not_injected_by_default(home_response):
     """Test that Plausible script is not injected when not configured."""
-    response = fastapi_client.get("/")
+    response = home_response
     assert response.status_code == 200
     content = response.content.decode()
     # Should not contain Plausible script when disabled
     assert "plausible.io" not in content.lower() or settings.enable_plausible
 
 
-def test_plausible_script_requires_both_settings(fastapi_client, monkeypatch):
+def test_plausible_script_requires_both_settings(home_response):
     """Test that Plausible script requires both enable_plausible and plausible_script_hash."""
     # This test verifies the logic in the template
     # When only enable_plausible is True but hash is missing, script should not be injected
-    response = fastapi_client.get("/")
+    response = home_response
     content = response.content.decode()
 
     # If Plausible is enabled and hash is set, script should be present
@@ -169,14 +190,9 @@ def test_username_redirect_to_lowercase(fastapi_client):
     assert "force=true" in location
 
 
-def test_empty_state_encouraging_message():
+def test_empty_state_encouraging_message(user_report_template):
     """Test that user_report.html template contains encouraging empty state message."""
-    # Read template and verify it contains the encouraging message
-    import os
-
-    template_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "gitbrag", "templates", "user_report.html")
-    with open(template_path) as f:
-        content = f.read()
+    content = user_report_template
 
     # Verify the encouraging message is in the template
     assert "Every open source journey starts somewhere" in content
@@ -185,13 +201,9 @@ def test_empty_state_encouraging_message():
     assert "🚀" in content  # Rocket emoji
 
 
-def test_company_name_with_at_symbol_becomes_link():
+def test_company_name_with_at_symbol_becomes_link(user_report_template):
     """Test that company names starting with @ are converted to GitHub profile links."""
-    import os
-
-    template_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "gitbrag", "templates", "user_report.html")
-    with open(template_path) as f:
-        content = f.read()
+    content = user_report_template
 
     # Verify the template has logic to convert @company to links
     assert "user_profile.company.startswith('@')" in content